@@ -4,130 +4,412 @@ SalonPro Manager - CLI Application
 Main entry point for the salon management system.
 """
 
-from database import init_db, get_session
-from models import Client, Stylist, Service, Appointment
-from datetime import datetime, date, timedelta, time
+from functools import lru_cache
+from datetime import datetime, date, time
+import argparse
+import csv
+import re
 import sys
 
 
+def _load_dependencies():
+    """Import the database layer into module scope.
+
+    These imports pull in SQLAlchemy and configure every mapper, so they are
+    deferred until the CLI has shown its banner.
+    """
+    global init_db, Client, Stylist, Service, Appointment, format_phone, format_date, format_time
+    global format_duration, format_price
+    global select, IntegrityError
+    from database import init_db
+    from models import Client, Stylist, Service, Appointment
+    from models.client import format_phone
+    from models.appointment import format_date, format_time
+    from models.service import format_duration, format_price
+    from sqlalchemy import select
+    from sqlalchemy.exc import IntegrityError
+
+
+def _blank_if_none(value):
+    """Map the 'none' answer to an optional field onto None."""
+    return None if value.lower() == 'none' else value
+
+
+def _parse_date(text):
+    """Parse a YYYY-MM-DD date; raises ValueError on bad input."""
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        # Still accept unpadded parts such as 2024-3-7
+        year, month, day = map(int, text.split('-'))
+        return date(year, month, day)
+
+
+def _parse_datetime(date_text, time_text):
+    """Parse a YYYY-MM-DD date and HH:MM time into a datetime; raises ValueError on bad input."""
+    hour, minute = map(int, time_text.split(':'))
+    return datetime.combine(_parse_date(date_text), time(hour, minute))
+
+
+# A comma only separates fields when another "name=" follows it, so
+# values such as notes may contain commas of their own
+_FIELD_SEPARATOR_RE = re.compile(r",\s*(?=\w+\s*=)")
+
+
+def _parse_field_updates(raw, fields, optional=()):
+    """Parse 'field=value,field=value' into an updates dict, raising ValueError on bad input."""
+    updates = {}
+    for pair in _FIELD_SEPARATOR_RE.split(raw):
+        name, sep, value = pair.partition("=")
+        name, value = name.strip().lower(), value.strip()
+        if not sep or name not in fields:
+            raise ValueError(f"Unknown field '{name}'. Use: {', '.join(fields)}")
+        if name in optional:
+            updates[name] = _blank_if_none(value) or None
+        elif value:
+            updates[name] = value
+        else:
+            raise ValueError(f"{name} cannot be empty.")
+    return updates
+
+
+@lru_cache(maxsize=1024)
+def _price_cell(price):
+    """Format a price for an appointment table column.
+
+    Appointments mostly carry their service's list price, so a long listing
+    repeats a handful of values; each is formatted once and reused.
+    """
+    return f"${price:<9.2f}"
+
+
+# Row templates for the streamed listings; calling a bound str.format with
+# positional arguments formats a row somewhat faster than the f-string did
+_CLIENT_ROW = "{0:<5} {1:<25} {2:<15} {3:<25}\n".format
+_STYLIST_ROW = "{0:<5} {1:<25} {2:<20} ${3:<11.2f} {4:<10}\n".format
+
+
+# Appointments fetched and shown per page of the full listing
+_APPOINTMENT_PAGE_SIZE = 50
+
+# Clients offered when scheduling; any client can still be picked by ID
+_PICK_LIST_CLIENTS = 10
+
+
+def _build_menu(title, options):
+    """Assemble a static menu block into a single printable string."""
+    divider = "-" * 40
+    return "\n".join(["", title, divider] + options + [divider]) + "\n"
+
+
+_BANNER = "\n".join([
+    "",
+    "=" * 60,
+    "       WELCOME TO SALONPRO MANAGER",
+    "=" * 60,
+    "Your complete salon management solution",
+    "=" * 60,
+]) + "\n"
+
+_GOODBYE = "\n".join([
+    "",
+    "=" * 60,
+    "Thank you for using SalonPro Manager!",
+    "Goodbye!",
+    "=" * 60,
+]) + "\n"
+
+# Menu text never changes, so it is built once at import time
+_MAIN_MENU = _build_menu("MAIN MENU", [
+    "1.  Client Management",
+    "2.  Stylist Management",
+    "3.  Service Management",
+    "4.  Appointment Management",
+    "5.  View Reports & Analytics",
+    "6.  Search & Find",
+    "0.  Exit Program",
+])
+
+_CLIENT_MENU = _build_menu("CLIENT MANAGEMENT", [
+    "1.  View All Clients",
+    "2.  Add New Client",
+    "3.  Find Client by ID",
+    "4.  Find Client by Name",
+    "5.  Find Client by Phone",
+    "6.  Update Client Information",
+    "7.  View Client's Appointment History",
+    "8.  Delete Client",
+    "9.  Bulk Add Clients",
+    "10. Back to Main Menu",
+])
+
+_STYLIST_MENU = _build_menu("STYLIST MANAGEMENT", [
+    "1.  View All Stylists",
+    "2.  Add New Stylist",
+    "3.  Find Stylist by ID",
+    "4.  Find Stylist by Specialty",
+    "5.  View Stylist's Schedule",
+    "6.  Update Stylist Information",
+    "7.  View Stylist's Clients",
+    "8.  Deactivate Stylist",
+    "9.  Bulk Deactivate Stylists",
+    "10. Back to Main Menu",
+])
+
+_SERVICE_MENU = _build_menu("SERVICE MANAGEMENT", [
+    "1.  View All Services",
+    "2.  View Service Menu (Active Only)",
+    "3.  Add New Service",
+    "4.  Find Service by ID",
+    "5.  Find Service by Category",
+    "6.  Update Service Information",
+    "7.  View Service Popularity",
+    "8.  Deactivate Service",
+    "9.  Back to Main Menu",
+])
+
+_APPOINTMENT_MENU = _build_menu("APPOINTMENT MANAGEMENT", [
+    "1.  View All Appointments",
+    "2.  View Today's Appointments",
+    "3.  View Upcoming Appointments",
+    "4.  Schedule New Appointment",
+    "5.  Find Appointment by ID",
+    "6.  Find Appointments by Date",
+    "7.  Find Appointments by Client",
+    "8.  Find Appointments by Stylist",
+    "9.  Update Appointment Status",
+    "10. Cancel Appointment",
+    "11. Delete Appointment",
+    "12. Back to Main Menu",
+])
+
+_SEARCH_MENU = _build_menu("SEARCH & FIND", [
+    "1.  Search Clients",
+    "2.  Search Appointments by Date Range",
+    "3.  Search Revenue by Date",
+    "4.  Back to Main Menu",
+])
+
+_REPORTS_MENU = _build_menu("REPORTS & ANALYTICS", [
+    "1. Daily Revenue Report",
+    "2. Client Count Report",
+    "3. Stylist Performance Report",
+    "4. Service Popularity Report",
+    "5. Back to Main Menu",
+])
+
+_SEARCH_CLIENTS_MENU = _build_menu("SEARCH CLIENTS", [
+    "1. By Name",
+    "2. By Phone",
+    "3. By Email",
+    "4. Back to Search Menu",
+])
+
+
 class SalonProCLI:
-    def __init__(self):
-        """Initialize the CLI application."""
+    def __init__(self, query_warn_threshold=None):
+        """Initialize the CLI application.
+
+        With query_warn_threshold set, any menu action issuing more SQL
+        statements than that is reported on stderr (a development aid).
+        """
+        # Bound once so every prompt skips the module attribute lookups
+        self._in = sys.stdin
+        self._out = sys.stdout
+        sys.stdout.write(_BANNER)
+        sys.stdout.flush()
+
+        _load_dependencies()
         self.session = init_db()
-        print("\n" + "="*60)
-        print("       WELCOME TO SALONPRO MANAGER")
-        print("="*60)
-        print("Your complete salon management solution")
-        print("="*60)
+
+        # Client and stylist lookups reused across a session; client entries
+        # are dropped on mutation
+        self._client_by_id_cache = {}
+        self._client_by_phone_cache = {}
+        self._stylist_by_id_cache = {}
+
+        # Rendered active-service menu; cleared whenever a service changes
+        self._service_menu_text = None
+
+        # Rendered client/stylist/service pick lists for scheduling, keyed
+        # by kind; each is dropped whenever the records behind it change
+        self._pick_lists = {}
+
+        # Clock reading shared by the read-only appointment views, refreshed
+        # once per appointment menu choice; bookings check the clock themselves
+        self._now = datetime.now()
+
+        # Menu dispatch tables: choice -> handler
+        self._main_dispatch = {
+            "0": self.exit_program,
+            "1": self.handle_client_management,
+            "2": self.handle_stylist_management,
+            "3": self.handle_service_management,
+            "4": self.handle_appointment_management,
+            "5": self.handle_reports,
+            "6": self.handle_search,
+        }
+        self._client_dispatch = {
+            "1": self.view_all_clients,
+            "2": self.add_new_client,
+            "3": self.find_client_by_id,
+            "4": self.find_client_by_name,
+            "5": self.find_client_by_phone,
+            "6": self.update_client,
+            "7": self.view_client_appointments,
+            "8": self.delete_client,
+            "9": self.bulk_add_clients,
+        }
+        self._stylist_dispatch = {
+            "1": self.view_all_stylists,
+            "2": self.add_new_stylist,
+            "3": self.find_stylist_by_id,
+            "4": self.find_stylist_by_specialty,
+            "5": self.view_stylist_schedule,
+            "6": self.update_stylist,
+            "7": self.view_stylist_clients,
+            "8": self.deactivate_stylist,
+            "9": self.bulk_deactivate_stylists,
+        }
+        self._service_dispatch = {
+            "1": self.view_all_services,
+            "2": self.view_service_menu,
+            "3": self.add_new_service,
+            "4": self.find_service_by_id,
+            "5": self.find_service_by_category,
+            "6": self.update_service,
+            "7": self.view_service_popularity,
+            "8": self.deactivate_service,
+        }
+        self._appointment_dispatch = {
+            "1": self.view_all_appointments,
+            "2": self.view_todays_appointments,
+            "3": self.view_upcoming_appointments,
+            "4": self.schedule_new_appointment,
+            "5": self.find_appointment_by_id,
+            "6": self.find_appointments_by_date,
+            "7": self.find_appointments_by_client,
+            "8": self.find_appointments_by_stylist,
+            "9": self.update_appointment_status,
+            "10": self.cancel_appointment,
+            "11": self.delete_appointment,
+        }
+        self._search_dispatch = {
+            "1": self.search_clients,
+            "2": self.search_appointments_by_date_range,
+            "3": self.search_revenue_by_date,
+        }
+        self._reports_dispatch = {
+            "1": self.daily_revenue_report,
+            "2": self.client_count_report,
+            "3": self.stylist_performance_report,
+            "4": self.view_service_popularity,
+        }
+        self._search_clients_dispatch = {
+            "1": self.search_clients_by_name,
+            "2": self.search_clients_by_phone,
+            "3": self.search_clients_by_email,
+        }
+
+        if query_warn_threshold is not None:
+            self._watch_queries(query_warn_threshold)
+
+    def _watch_queries(self, threshold):
+        """Wrap every menu action so one issuing over threshold queries is reported."""
+        from models._debug import count_queries
+        bind = self.session.get_bind()
+
+        def counted(handler):
+            def run_counted():
+                # Counted on the engine: a commit inside the action hands
+                # the session a new connection
+                with count_queries(bind) as statements:
+                    handler()
+                if len(statements) > threshold:
+                    print(f"WARNING: N+1? {handler.__name__} ran {len(statements)} queries:", file=sys.stderr)
+                    for statement in statements:
+                        print(f"  {statement}", file=sys.stderr)
+            return run_counted
+
+        # The main menu entries are submenu loops; only the actions they
+        # dispatch to are measured
+        for dispatch in (self._client_dispatch, self._stylist_dispatch, self._service_dispatch,
+                         self._appointment_dispatch, self._search_dispatch, self._reports_dispatch,
+                         self._search_clients_dispatch):
+            for choice, handler in dispatch.items():
+                dispatch[choice] = counted(handler)
 
     def display_main_menu(self):
         """Display the main menu options."""
-        print("\nMAIN MENU")
-        print("-" * 40)
-        print("1.  Client Management")
-        print("2.  Stylist Management")
-        print("3.  Service Management")
-        print("4.  Appointment Management")
-        print("5.  View Reports & Analytics")
-        print("6.  Search & Find")
-        print("0.  Exit Program")
-        print("-" * 40)
+        sys.stdout.write(_MAIN_MENU)
 
     def client_management_menu(self):
         """Display client management menu."""
-        print("\nCLIENT MANAGEMENT")
-        print("-" * 40)
-        print("1.  View All Clients")
-        print("2.  Add New Client")
-        print("3.  Find Client by ID")
-        print("4.  Find Client by Name")
-        print("5.  Find Client by Phone")
-        print("6.  Update Client Information")
-        print("7.  View Client's Appointment History")
-        print("8.  Delete Client")
-        print("9.  Back to Main Menu")
-        print("-" * 40)
+        sys.stdout.write(_CLIENT_MENU)
 
     def stylist_management_menu(self):
         """Display stylist management menu."""
-        print("\nSTYLIST MANAGEMENT")
-        print("-" * 40)
-        print("1.  View All Stylists")
-        print("2.  Add New Stylist")
-        print("3.  Find Stylist by ID")
-        print("4.  Find Stylist by Specialty")
-        print("5.  View Stylist's Schedule")
-        print("6.  Update Stylist Information")
-        print("7.  View Stylist's Clients")
-        print("8.  Deactivate Stylist")
-        print("9.  Back to Main Menu")
-        print("-" * 40)
+        sys.stdout.write(_STYLIST_MENU)
 
     def service_management_menu(self):
         """Display service management menu."""
-        print("\nSERVICE MANAGEMENT")
-        print("-" * 40)
-        print("1.  View All Services")
-        print("2.  View Service Menu (Active Only)")
-        print("3.  Add New Service")
-        print("4.  Find Service by ID")
-        print("5.  Find Service by Category")
-        print("6.  Update Service Information")
-        print("7.  View Service Popularity")
-        print("8.  Deactivate Service")
-        print("9.  Back to Main Menu")
-        print("-" * 40)
+        sys.stdout.write(_SERVICE_MENU)
 
     def appointment_management_menu(self):
         """Display appointment management menu."""
-        print("\nAPPOINTMENT MANAGEMENT")
-        print("-" * 40)
-        print("1.  View All Appointments")
-        print("2.  View Today's Appointments")
-        print("3.  View Upcoming Appointments")
-        print("4.  Schedule New Appointment")
-        print("5.  Find Appointment by ID")
-        print("6.  Find Appointments by Date")
-        print("7.  Find Appointments by Client")
-        print("8.  Find Appointments by Stylist")
-        print("9.  Update Appointment Status")
-        print("10. Cancel Appointment")
-        print("11. Delete Appointment")
-        print("12. Back to Main Menu")
-        print("-" * 40)
+        sys.stdout.write(_APPOINTMENT_MENU)
 
     def search_menu(self):
         """Display search menu."""
-        print("\nSEARCH & FIND")
-        print("-" * 40)
-        print("1.  Search Clients")
-        print("2.  Search Appointments by Date Range")
-        print("3.  Search Revenue by Date")
-        print("4.  Back to Main Menu")
-        print("-" * 40)
+        sys.stdout.write(_SEARCH_MENU)
+
+    def _prompt(self, message):
+        """Show a prompt and return the user's reply with surrounding whitespace removed."""
+        self._out.write(message)
+        self._out.flush()
+        line = self._in.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
+
+    def _prompt_fields(self, *labels):
+        """Prompt for each label in turn, or read them all from one '|'-separated line.
+
+        Answering the first prompt with '!batch' asks for a single line such as
+        'Ann|Lee|5551234567|ann@example.com|' instead of one prompt per field.
+        Missing trailing fields come back as empty strings.
+        """
+        first = self._prompt(labels[0])
+        if first != "!batch":
+            return [first] + [self._prompt(label) for label in labels[1:]]
+
+        names = " | ".join(label.split(" (")[0].rstrip(": ") for label in labels)
+        line = self._prompt(f"{names}: ")
+        values = [value.strip() for value in line.split("|", len(labels) - 1)]
+        return values + [""] * (len(labels) - len(values))
+
+    def _prompt_id(self, message):
+        """Prompt for a record ID; raises ValueError if the reply is not an integer."""
+        return int(self._prompt(message))
 
     def run(self):
         """Main loop to run the CLI application."""
-        while True:
-            self.display_main_menu()
-            choice = input("\nEnter your choice (0-6): ").strip()
-
-            if choice == "0":
-                self.exit_program()
-            elif choice == "1":
-                self.handle_client_management()
-            elif choice == "2":
-                self.handle_stylist_management()
-            elif choice == "3":
-                self.handle_service_management()
-            elif choice == "4":
-                self.handle_appointment_management()
-            elif choice == "5":
-                self.handle_reports()
-            elif choice == "6":
-                self.handle_search()
-            else:
-                print("Invalid choice. Please enter a number between 0-6.")
+        try:
+            while True:
+                self.display_main_menu()
+                choice = self._prompt("\nEnter your choice (0-6): ")
+
+                handler = self._main_dispatch.get(choice)
+                if handler:
+                    handler()
+                else:
+                    print("Invalid choice. Please enter a number between 0-6.")
+        except (KeyboardInterrupt, EOFError):
+            # Ctrl-C or end of input mid-flow: drop any half-made change and
+            # close the session rather than dying with a traceback
+            self.session.rollback()
+            print()
+            self.exit_program()
 
     # ========== CLIENT MANAGEMENT METHODS ==========
 
@@ -135,43 +417,77 @@ class SalonProCLI:
         """Handle client management operations."""
         while True:
             self.client_management_menu()
-            choice = input("\nEnter your choice (1-9): ").strip()
+            choice = self._prompt("\nEnter your choice (1-10): ")
 
-            if choice == "9":
+            if choice == "10":
                 break
-            elif choice == "1":
-                self.view_all_clients()
-            elif choice == "2":
-                self.add_new_client()
-            elif choice == "3":
-                self.find_client_by_id()
-            elif choice == "4":
-                self.find_client_by_name()
-            elif choice == "5":
-                self.find_client_by_phone()
-            elif choice == "6":
-                self.update_client()
-            elif choice == "7":
-                self.view_client_appointments()
-            elif choice == "8":
-                self.delete_client()
+
+            handler = self._client_dispatch.get(choice)
+            if handler:
+                handler()
             else:
-                print("Invalid choice. Please enter a number between 1-9.")
+                print("Invalid choice. Please enter a number between 1-10.")
+
+    def _cache_client(self, client):
+        """Remember a client under both its ID and phone number."""
+        self._client_by_id_cache[client.id] = client
+        self._client_by_phone_cache[client.phone] = client
+
+    def _forget_client(self, client):
+        """Drop a client from the lookup caches."""
+        self._client_by_id_cache.pop(client.id, None)
+        self._client_by_phone_cache.pop(client.phone, None)
+
+    def _get_client(self, client_id):
+        """Find a client by ID, reusing an earlier lookup when possible."""
+        client = self._client_by_id_cache.get(client_id)
+        if client is None:
+            client = Client.find_by_id(self.session, client_id)
+            if client:
+                self._cache_client(client)
+        return client
+
+    def _get_client_with_count(self, client_id):
+        """Find a client and its appointment count; one query unless the client is cached."""
+        client = self._client_by_id_cache.get(client_id)
+        if client is not None:
+            return client, Client.count_appointments(self.session, client_id)
+        row = Client.find_with_stats(self.session, client_id)
+        if row is None:
+            return None, 0
+        client, appointment_count = row
+        self._cache_client(client)
+        return client, appointment_count
+
+    def _get_client_by_phone(self, phone):
+        """Find a client by phone, reusing an earlier lookup when possible."""
+        client = self._client_by_phone_cache.get(phone)
+        if client is None:
+            client = Client.find_by_phone(self.session, phone)
+            if client:
+                self._cache_client(client)
+        return client
 
     def view_all_clients(self):
         """Display all clients."""
-        clients = Client.get_all(self.session)
-        if not clients:
+        total = Client.count_all(self.session)
+        if not total:
             print("\nNo clients found.")
             return
 
-        print(f"\nALL CLIENTS ({len(clients)} total)")
+        print(f"\nALL CLIENTS ({total} total)")
         print("-" * 70)
         print(f"{'ID':<5} {'Name':<25} {'Phone':<15} {'Email':<25}")
         print("-" * 70)
 
-        for client in clients:
-            print(f"{client.id:<5} {client.full_name:<25} {client.formatted_phone:<15} {client.email or 'N/A':<25}")
+        # Only the listed columns are selected, so no Client objects are built,
+        # and rows are fetched and written 500 at a time
+        rows = Client.get_all_summary(self.session)
+        for batch in rows.partitions():
+            sys.stdout.write("".join(
+                _CLIENT_ROW(client_id, first_name + ' ' + last_name, format_phone(phone), email or 'N/A')
+                for client_id, first_name, last_name, phone, email in batch
+            ))
 
     def add_new_client(self):
         """Add a new client to the database."""
@@ -179,18 +495,22 @@ class SalonProCLI:
         print("-" * 40)
 
         try:
-            first_name = input("First Name: ").strip()
-            last_name = input("Last Name: ").strip()
-            phone = input("Phone Number: ").strip()
-            email = input("Email (optional): ").strip() or None
-            notes = input("Notes (optional): ").strip() or None
+            first_name, last_name, phone, email, notes = self._prompt_fields(
+                "First Name: ",
+                "Last Name: ",
+                "Phone Number: ",
+                "Email (optional): ",
+                "Notes (optional): "
+            )
+            email = email or None
+            notes = notes or None
 
             if not first_name or not last_name or not phone:
                 print("First name, last name, and phone are required.")
                 return
 
             # Check if phone already exists
-            existing = Client.find_by_phone(self.session, phone)
+            existing = self._get_client_by_phone(phone)
             if existing:
                 print(f"Phone number already registered to {existing.full_name}")
                 return
@@ -203,6 +523,7 @@ class SalonProCLI:
                 email=email,
                 notes=notes
             )
+            self._invalidate_pick_list('clients')
 
             print(f"\nClient added successfully!")
             print(f"   Name: {client.full_name}")
@@ -211,14 +532,74 @@ class SalonProCLI:
         except Exception as e:
             print(f"Error adding client: {e}")
 
+    def bulk_add_clients(self):
+        """Add many clients at once from comma-separated lines."""
+        print("\nBULK ADD CLIENTS")
+        print("-" * 40)
+        print("One client per line: First,Last,Phone[,Email[,Notes]]")
+        print("Finish with a blank line.")
+
+        rows = []
+        seen_phones = set()
+        line_no = 0
+        while True:
+            try:
+                line = self._prompt("")
+            except EOFError:
+                break
+            if not line:
+                break
+            line_no += 1
+
+            fields = [field.strip() for field in line.split(",", 4)]
+            fields += [""] * (5 - len(fields))
+            first_name, last_name, phone, email, notes = fields
+            if not first_name or not last_name or not phone:
+                print(f"Line {line_no} skipped: first name, last name, and phone are required.")
+                continue
+            if phone in seen_phones:
+                print(f"Line {line_no} skipped: phone {phone} appears earlier in this batch.")
+                continue
+            seen_phones.add(phone)
+            rows.append({
+                'first_name': first_name,
+                'last_name': last_name,
+                'phone': phone,
+                'email': email or None,
+                'notes': notes or None,
+            })
+
+        if not rows:
+            print("\nNo clients to add.")
+            return
+
+        try:
+            # One IN (...) lookup covers every phone in the batch
+            taken = Client.find_phones_in(self.session, [row['phone'] for row in rows])
+            for phone in sorted(taken):
+                print(f"Phone number {phone} already registered, skipped.")
+            rows = [row for row in rows if row['phone'] not in taken]
+            if not rows:
+                print("\nNo clients to add.")
+                return
+
+            clients = Client.bulk_create(self.session, rows)
+            self._invalidate_pick_list('clients')
+
+            print(f"\n{len(clients)} client(s) added successfully!")
+
+        except Exception as e:
+            self.session.rollback()
+            print(f"Error adding clients: {e}")
+
     def find_client_by_id(self):
         """Find a client by their ID."""
         try:
-            client_id = int(input("\nEnter Client ID: ").strip())
-            client = Client.find_by_id(self.session, client_id)
+            client_id = self._prompt_id("\nEnter Client ID: ")
+            client, appointment_count = self._get_client_with_count(client_id)
 
             if client:
-                self.display_client_details(client)
+                self.display_client_details(client, appointment_count)
             else:
                 print(f"No client found with ID {client_id}")
         except ValueError:
@@ -226,12 +607,12 @@ class SalonProCLI:
 
     def find_client_by_name(self):
         """Find clients by name (partial match)."""
-        name = input("\nEnter client name (or part): ").strip()
+        name = self._prompt("\nEnter client name (or part): ")
         if not name:
             print("Please enter a name to search.")
             return
 
-        clients = Client.find_by_name(self.session, name)
+        clients = Client.search_summary(self.session, name=name)
 
         if not clients:
             print(f"No clients found matching '{name}'")
@@ -239,82 +620,86 @@ class SalonProCLI:
 
         print(f"\nFOUND {len(clients)} CLIENT(S)")
         print("-" * 70)
-        for client in clients:
-            print(f"ID: {client.id} | Name: {client.full_name} | Phone: {client.formatted_phone}")
+        for client_id, first_name, last_name, phone, email in clients:
+            print(f"ID: {client_id} | Name: {first_name} {last_name} | Phone: {format_phone(phone)}")
 
     def find_client_by_phone(self):
         """Find a client by phone number."""
-        phone = input("\nEnter phone number: ").strip()
+        phone = self._prompt("\nEnter phone number: ")
         if not phone:
             print("Please enter a phone number.")
             return
 
-        client = Client.find_by_phone(self.session, phone)
+        client = self._get_client_by_phone(phone)
 
         if client:
             self.display_client_details(client)
         else:
             print(f"No client found with phone {phone}")
 
-    def display_client_details(self, client):
-        """Display detailed information about a client."""
+    def display_client_details(self, client, appointment_count=None):
+        """Display detailed information about a client; the appointment count is queried unless given."""
         print(f"\nCLIENT DETAILS")
         print("-" * 40)
-        print(f"ID: {client.id}")
+        client_id, email = client.id, client.email
+        print(f"ID: {client_id}")
         print(f"Name: {client.full_name}")
         print(f"Phone: {client.formatted_phone}")
-        print(f"Email: {client.email or 'Not provided'}")
+        print(f"Email: {email or 'Not provided'}")
         print(f"Email Valid: {'Yes' if client.email_is_valid else 'No'}")
         print(f"Notes: {client.notes or 'None'}")
-        print(f"Created: {client.created_at.strftime('%Y-%m-%d')}")
+        print(f"Created: {client.created_at.isoformat()[:10]}")
 
         # Show appointment count
-        appointments = client.get_appointments(self.session)
-        print(f"Total Appointments: {len(appointments)}")
+        if appointment_count is None:
+            appointment_count = Client.count_appointments(self.session, client_id)
+        print(f"Total Appointments: {appointment_count}")
 
     def update_client(self):
         """Update client information."""
         try:
-            client_id = int(input("\nEnter Client ID to update: ").strip())
-            client = Client.find_by_id(self.session, client_id)
+            client_id = self._prompt_id("\nEnter Client ID to update: ")
+            client, appointment_count = self._get_client_with_count(client_id)
 
             if not client:
                 print(f"No client found with ID {client_id}")
                 return
 
-            self.display_client_details(client)
+            self.display_client_details(client, appointment_count)
             print("\nUPDATE CLIENT (leave blank to keep current value)")
+            print("Or enter field=value,... at the first prompt, e.g. phone=5551234567,email=none")
             print("-" * 40)
 
+            new_first = self._prompt(f"First Name [{client.first_name}]: ")
+            if "=" in new_first:
+                self._apply_client_updates(client, new_first)
+                return
+
             updates = {}
 
-            new_first = input(f"First Name [{client.first_name}]: ").strip()
             if new_first:
                 updates['first_name'] = new_first
 
-            new_last = input(f"Last Name [{client.last_name}]: ").strip()
+            new_last = self._prompt(f"Last Name [{client.last_name}]: ")
             if new_last:
                 updates['last_name'] = new_last
 
-            new_phone = input(f"Phone [{client.phone}]: ").strip()
+            new_phone = self._prompt(f"Phone [{client.phone}]: ")
             if new_phone and new_phone != client.phone:
-                # Check if new phone already exists
-                existing = Client.find_by_phone(self.session, new_phone)
-                if existing and existing.id != client_id:
-                    print(f"Phone number already registered to {existing.full_name}")
+                if self._phone_taken(client, new_phone):
                     return
                 updates['phone'] = new_phone
 
-            new_email = input(f"Email [{client.email or 'None'}]: ").strip()
+            new_email = self._prompt(f"Email [{client.email or 'None'}]: ")
             if new_email:
-                updates['email'] = new_email if new_email.lower() != 'none' else None
+                updates['email'] = _blank_if_none(new_email)
 
-            new_notes = input(f"Notes [{client.notes or 'None'}]: ").strip()
+            new_notes = self._prompt(f"Notes [{client.notes or 'None'}]: ")
             if new_notes:
-                updates['notes'] = new_notes if new_notes.lower() != 'none' else None
+                updates['notes'] = _blank_if_none(new_notes)
 
             if updates:
-                Client.update(self.session, client_id, **updates)
+                self._save_client_updates(client, updates)
                 print(f"\nClient {client_id} updated successfully!")
             else:
                 print("\nNo changes made.")
@@ -324,31 +709,75 @@ class SalonProCLI:
         except Exception as e:
             print(f"Error updating client: {e}")
 
+    def _apply_client_updates(self, client, raw):
+        """Apply a one-line field=value update to a client."""
+        try:
+            updates = _parse_field_updates(
+                raw,
+                ('first_name', 'last_name', 'phone', 'email', 'notes'),
+                optional=('email', 'notes')
+            )
+        except ValueError as e:
+            print(e)
+            return
+
+        new_phone = updates.get('phone')
+        if new_phone == client.phone:
+            del updates['phone']
+        elif new_phone and self._phone_taken(client, new_phone):
+            return
+
+        if updates:
+            self._save_client_updates(client, updates)
+            print(f"\nClient {client.id} updated successfully!")
+        else:
+            print("\nNo changes made.")
+
+    def _phone_taken(self, client, phone):
+        """Report and return True if another client already holds the phone number."""
+        owner = Client.find_name_by_phone(self.session, phone, exclude_id=client.id)
+        if owner:
+            print(f"Phone number already registered to {owner}")
+        return owner is not None
+
+    def _save_client_updates(self, client, updates):
+        """Write client changes and keep the lookup caches in step."""
+        client_id = client.id
+        self._forget_client(client)
+        Client.update(self.session, client_id, **updates)
+        self._invalidate_pick_list('clients')
+
     def view_client_appointments(self):
         """View all appointments for a specific client."""
         try:
-            client_id = int(input("\nEnter Client ID: ").strip())
-            client = Client.find_by_id(self.session, client_id)
+            client_id = self._prompt_id("\nEnter Client ID: ")
+            client = self._get_client(client_id)
 
             if not client:
                 print(f"No client found with ID {client_id}")
                 return
 
-            appointments = client.get_appointments(self.session)
+            full_name = client.full_name
+            total = Client.count_appointments(self.session, client_id)
 
-            if not appointments:
-                print(f"\nNo appointments found for {client.full_name}")
+            if not total:
+                print(f"\nNo appointments found for {full_name}")
                 return
 
-            print(f"\nAPPOINTMENTS FOR {client.full_name.upper()} ({len(appointments)} total)")
+            print(f"\nAPPOINTMENTS FOR {full_name.upper()} ({total} total)")
             print("-" * 90)
             print(f"{'Date':<20} {'Time':<10} {'Stylist':<20} {'Service':<25} {'Status':<12} {'Price':<10}")
             print("-" * 90)
 
-            for app in appointments:
-                stylist_name = app.stylist.full_name if app.stylist else "N/A"
-                service_name = app.service.name if app.service else "N/A"
-                print(f"{app.date_only:<20} {app.time_only:<10} {stylist_name:<20} {service_name:<25} {app.status:<12} ${app.total_price:<9.2f}")
+            appointments = Appointment.iter_by_client_with_details(self.session, client_id)
+            for batch in appointments.partitions():
+                lines = []
+                for app in batch:
+                    stylist, service = app.stylist, app.service
+                    stylist_name = stylist.full_name if stylist else "N/A"
+                    service_name = service.name if service else "N/A"
+                    lines.append(f"{app.date_only:<20} {app.time_only:<10} {stylist_name:<20} {service_name:<25} {app.status:<12} {_price_cell(app.total_price)}\n")
+                sys.stdout.write("".join(lines))
 
         except ValueError:
             print("Please enter a valid number.")
@@ -356,31 +785,34 @@ class SalonProCLI:
     def delete_client(self):
         """Delete a client from the database."""
         try:
-            client_id = int(input("\nEnter Client ID to delete: ").strip())
-            client = Client.find_by_id(self.session, client_id)
+            client_id = self._prompt_id("\nEnter Client ID to delete: ")
+            client, appointment_count = self._get_client_with_count(client_id)
 
             if not client:
                 print(f"No client found with ID {client_id}")
                 return
 
             # Show client details first
-            self.display_client_details(client)
+            self.display_client_details(client, appointment_count)
 
             # Ask for confirmation
-            confirm = input(f"\nAre you sure you want to delete {client.full_name}? (yes/no): ").strip().lower()
+            confirm = self._prompt(f"\nAre you sure you want to delete {client.full_name}? (yes/no): ").lower()
 
             if confirm == 'yes':
-                # Check if client has appointments
-                appointments = client.get_appointments(self.session)
-                if appointments:
-                    print(f"Cannot delete client with {len(appointments)} existing appointment(s).")
-                    print("   Please cancel or reassign appointments first.")
-                    return
-
-                if Client.delete(self.session, client_id):
-                    print(f"Client {client.full_name} deleted successfully!")
+                # The appointment check and the delete are one statement, so an
+                # appointment booked after the details were shown still blocks it
+                full_name = client.full_name
+                self._forget_client(client)
+                if Client.delete_if_no_appointments(self.session, client_id):
+                    self._invalidate_pick_list('clients')
+                    print(f"Client {full_name} deleted successfully!")
                 else:
-                    print(f"Failed to delete client.")
+                    appointment_count = Client.count_appointments(self.session, client_id)
+                    if appointment_count:
+                        print(f"Cannot delete client with {appointment_count} existing appointment(s).")
+                        print("   Please cancel or reassign appointments first.")
+                    else:
+                        print(f"Failed to delete client.")
             else:
                 print("Deletion cancelled.")
 
@@ -391,10 +823,7 @@ class SalonProCLI:
 
     def exit_program(self):
         """Exit the program gracefully."""
-        print("\n" + "="*60)
-        print("Thank you for using SalonPro Manager!")
-        print("Goodbye!")
-        print("="*60)
+        sys.stdout.write(_GOODBYE)
         self.session.close()
         sys.exit(0)
 
@@ -404,44 +833,46 @@ class SalonProCLI:
         """Handle stylist management operations."""
         while True:
             self.stylist_management_menu()
-            choice = input("\nEnter your choice (1-9): ").strip()
+            choice = self._prompt("\nEnter your choice (1-10): ")
             
-            if choice == "9":
+            if choice == "10":
                 break
-            elif choice == "1":
-                self.view_all_stylists()
-            elif choice == "2":
-                self.add_new_stylist()
-            elif choice == "3":
-                self.find_stylist_by_id()
-            elif choice == "4":
-                self.find_stylist_by_specialty()
-            elif choice == "5":
-                self.view_stylist_schedule()
-            elif choice == "6":
-                self.update_stylist()
-            elif choice == "7":
-                self.view_stylist_clients()
-            elif choice == "8":
-                self.deactivate_stylist()
+
+            handler = self._stylist_dispatch.get(choice)
+            if handler:
+                handler()
             else:
-                print("Invalid choice. Please enter a number between 1-9.")
+                print("Invalid choice. Please enter a number between 1-10.")
+    
+    def _get_stylist(self, stylist_id):
+        """Find a stylist by ID, reusing an earlier lookup when possible."""
+        stylist = self._stylist_by_id_cache.get(stylist_id)
+        if stylist is None:
+            stylist = Stylist.find_by_id(self.session, stylist_id)
+            if stylist:
+                self._stylist_by_id_cache[stylist_id] = stylist
+        return stylist
     
     def view_all_stylists(self):
         """Display all stylists."""
-        stylists = Stylist.get_all(self.session)
-        if not stylists:
+        total = Stylist.count_all(self.session)
+        if not total:
             print("\nNo stylists found.")
             return
         
-        print(f"\nALL STYLISTS ({len(stylists)} total)")
+        print(f"\nALL STYLISTS ({total} total)")
         print("-" * 80)
         print(f"{'ID':<5} {'Name':<25} {'Specialty':<20} {'Hourly Rate':<12} {'Status':<10}")
         print("-" * 80)
         
-        for stylist in stylists:
-            status = "Active" if stylist.is_active else "Inactive"
-            print(f"{stylist.id:<5} {stylist.full_name:<25} {stylist.specialty or 'N/A':<20} ${stylist.hourly_rate:<11.2f} {status:<10}")
+        # Only the listed columns are selected, so no Stylist objects are built,
+        # and rows are fetched and written 500 at a time
+        rows = Stylist.get_all_summary(self.session)
+        for batch in rows.partitions():
+            sys.stdout.write("".join(
+                _STYLIST_ROW(stylist_id, first_name + ' ' + last_name, specialty or 'N/A', hourly_rate, 'Active' if is_active else 'Inactive')
+                for stylist_id, first_name, last_name, specialty, hourly_rate, is_active in batch
+            ))
     
     def add_new_stylist(self):
         """Add a new stylist to the database."""
@@ -449,12 +880,14 @@ class SalonProCLI:
         print("-" * 40)
         
         try:
-            first_name = input("First Name: ").strip()
-            last_name = input("Last Name: ").strip()
-            phone = input("Phone Number: ").strip()
-            email = input("Email: ").strip()
-            specialty = input("Specialty (e.g., Coloring, Haircut): ").strip()
-            hourly_rate = input("Hourly Rate (default 25.00): ").strip()
+            first_name, last_name, phone, email, specialty, hourly_rate = self._prompt_fields(
+                "First Name: ",
+                "Last Name: ",
+                "Phone Number: ",
+                "Email: ",
+                "Specialty (e.g., Coloring, Haircut): ",
+                "Hourly Rate (default 25.00): "
+            )
             
             if not first_name or not last_name or not phone or not email:
                 print("First name, last name, phone, and email are required.")
@@ -468,9 +901,9 @@ class SalonProCLI:
                 return
             
             # Check if phone already exists
-            existing = self.session.query(Stylist).filter_by(phone=phone).first()
-            if existing:
-                print(f"Phone number already registered to {existing.full_name}")
+            owner = Stylist.find_name_by_phone(self.session, phone)
+            if owner:
+                print(f"Phone number already registered to {owner}")
                 return
             
             stylist = Stylist.create(
@@ -482,6 +915,7 @@ class SalonProCLI:
                 specialty=specialty,
                 hourly_rate=hourly_rate
             )
+            self._invalidate_pick_list('stylists')
             
             print(f"\nStylist added successfully!")
             print(f"   Name: {stylist.full_name}")
@@ -494,8 +928,8 @@ class SalonProCLI:
     def find_stylist_by_id(self):
         """Find a stylist by their ID."""
         try:
-            stylist_id = int(input("\nEnter Stylist ID: ").strip())
-            stylist = Stylist.find_by_id(self.session, stylist_id)
+            stylist_id = self._prompt_id("\nEnter Stylist ID: ")
+            stylist = self._get_stylist(stylist_id)
             
             if stylist:
                 self.display_stylist_details(stylist)
@@ -506,7 +940,7 @@ class SalonProCLI:
     
     def find_stylist_by_specialty(self):
         """Find stylists by specialty."""
-        specialty = input("\nEnter specialty to search: ").strip()
+        specialty = self._prompt("\nEnter specialty to search: ")
         if not specialty:
             print("Please enter a specialty to search.")
             return
@@ -535,11 +969,10 @@ class SalonProCLI:
         print(f"Hourly Rate: ${stylist.hourly_rate:.2f}")
         print(f"Experience: {stylist.experience_years} years")
         print(f"Status: {'Active' if stylist.is_active else 'Inactive'}")
-        print(f"Hire Date: {stylist.hire_date.strftime('%Y-%m-%d')}")
+        print(f"Hire Date: {stylist.hire_date.isoformat()[:10]}")
         
         # Show appointment count
-        appointments = stylist.get_appointments(self.session)
-        print(f"Total Appointments: {len(appointments)}")
+        print(f"Total Appointments: {Stylist.count_appointments(self.session, stylist.id)}")
         
         # Show today's appointments
         todays = stylist.get_todays_appointments(self.session)
@@ -549,16 +982,15 @@ class SalonProCLI:
     def view_stylist_schedule(self):
         """View a stylist's schedule."""
         try:
-            stylist_id = int(input("\nEnter Stylist ID: ").strip())
-            stylist = Stylist.find_by_id(self.session, stylist_id)
+            stylist_id = self._prompt_id("\nEnter Stylist ID: ")
+            stylist = self._get_stylist(stylist_id)
             
             if not stylist:
                 print(f"No stylist found with ID {stylist_id}")
                 return
             
             # Get upcoming appointments
-            appointments = Appointment.find_by_stylist(self.session, stylist_id)
-            upcoming = [app for app in appointments if app.is_upcoming]
+            upcoming = Appointment.find_upcoming_by_stylist(self.session, stylist_id)
             
             if not upcoming:
                 print(f"\nNo upcoming appointments for {stylist.full_name}")
@@ -569,10 +1001,13 @@ class SalonProCLI:
             print(f"{'Date':<12} {'Time':<10} {'Client':<20} {'Service':<25} {'Duration':<10} {'Price':<10}")
             print("-" * 90)
             
-            for app in sorted(upcoming, key=lambda x: x.appointment_date):
-                client_name = app.client.full_name if app.client else "N/A"
-                service_name = app.service.name if app.service else "N/A"
-                print(f"{app.date_only:<12} {app.time_only:<10} {client_name:<20} {service_name:<25} {app.duration_minutes} min{'':<5} ${app.total_price:<9.2f}")
+            lines = []
+            for app in upcoming:
+                client, service = app.client, app.service
+                client_name = client.full_name if client else "N/A"
+                service_name = service.name if service else "N/A"
+                lines.append(f"{app.date_only:<12} {app.time_only:<10} {client_name:<20} {service_name:<25} {app.duration_minutes} min{'':<5} {_price_cell(app.total_price)}")
+            sys.stdout.write("\n".join(lines) + "\n")
                 
         except ValueError:
             print("Please enter a valid number.")
@@ -580,8 +1015,8 @@ class SalonProCLI:
     def update_stylist(self):
         """Update stylist information."""
         try:
-            stylist_id = int(input("\nEnter Stylist ID to update: ").strip())
-            stylist = Stylist.find_by_id(self.session, stylist_id)
+            stylist_id = self._prompt_id("\nEnter Stylist ID to update: ")
+            stylist = self._get_stylist(stylist_id)
             
             if not stylist:
                 print(f"No stylist found with ID {stylist_id}")
@@ -593,32 +1028,32 @@ class SalonProCLI:
             
             updates = {}
             
-            new_first = input(f"First Name [{stylist.first_name}]: ").strip()
+            new_first = self._prompt(f"First Name [{stylist.first_name}]: ")
             if new_first:
                 updates['first_name'] = new_first
             
-            new_last = input(f"Last Name [{stylist.last_name}]: ").strip()
+            new_last = self._prompt(f"Last Name [{stylist.last_name}]: ")
             if new_last:
                 updates['last_name'] = new_last
             
-            new_phone = input(f"Phone [{stylist.phone}]: ").strip()
+            new_phone = self._prompt(f"Phone [{stylist.phone}]: ")
             if new_phone and new_phone != stylist.phone:
                 # Check if new phone already exists
-                existing = self.session.query(Stylist).filter_by(phone=new_phone).first()
-                if existing and existing.id != stylist_id:
-                    print(f"Phone number already registered to {existing.full_name}")
+                owner = Stylist.find_name_by_phone(self.session, new_phone, exclude_id=stylist_id)
+                if owner:
+                    print(f"Phone number already registered to {owner}")
                     return
                 updates['phone'] = new_phone
             
-            new_email = input(f"Email [{stylist.email}]: ").strip()
+            new_email = self._prompt(f"Email [{stylist.email}]: ")
             if new_email:
                 updates['email'] = new_email
             
-            new_specialty = input(f"Specialty [{stylist.specialty}]: ").strip()
+            new_specialty = self._prompt(f"Specialty [{stylist.specialty}]: ")
             if new_specialty:
                 updates['specialty'] = new_specialty
             
-            new_rate = input(f"Hourly Rate [${stylist.hourly_rate:.2f}]: ").strip()
+            new_rate = self._prompt(f"Hourly Rate [${stylist.hourly_rate:.2f}]: ")
             if new_rate:
                 try:
                     updates['hourly_rate'] = float(new_rate.replace('$', ''))
@@ -628,6 +1063,7 @@ class SalonProCLI:
             
             if updates:
                 Stylist.update(self.session, stylist_id, **updates)
+                self._invalidate_pick_list('stylists')
                 print(f"\nStylist {stylist_id} updated successfully!")
             else:
                 print("\nNo changes made.")
@@ -640,35 +1076,25 @@ class SalonProCLI:
     def view_stylist_clients(self):
         """View all clients of a specific stylist."""
         try:
-            stylist_id = int(input("\nEnter Stylist ID: ").strip())
-            stylist = Stylist.find_by_id(self.session, stylist_id)
+            stylist_id = self._prompt_id("\nEnter Stylist ID: ")
+            stylist = self._get_stylist(stylist_id)
             
             if not stylist:
                 print(f"No stylist found with ID {stylist_id}")
                 return
             
-            # Get all appointments for this stylist
-            appointments = Appointment.find_by_stylist(self.session, stylist_id)
+            # Names and per-client counts come back already grouped from one query
+            rows = Stylist.client_summary(self.session, stylist_id)
             
-            if not appointments:
+            if not rows:
                 print(f"\nNo appointments found for {stylist.full_name}")
                 return
             
-            # Get unique clients
-            client_ids = set()
-            for app in appointments:
-                if app.client:
-                    client_ids.add(app.client.id)
-            
-            print(f"\nCLIENTS OF {stylist.full_name.upper()} ({len(client_ids)} unique clients)")
+            print(f"\nCLIENTS OF {stylist.full_name.upper()} ({len(rows)} unique clients)")
             print("-" * 70)
             
-            for client_id in client_ids:
-                client = Client.find_by_id(self.session, client_id)
-                if client:
-                    # Count appointments with this stylist
-                    client_appointments = [app for app in appointments if app.client_id == client_id]
-                    print(f"• {client.full_name} ({len(client_appointments)} appointments)")
+            for client_id, first_name, last_name, appointment_count in rows:
+                print(f"• {first_name} {last_name} ({appointment_count} appointments)")
                     
         except ValueError:
             print("Please enter a valid number.")
@@ -676,8 +1102,8 @@ class SalonProCLI:
     def deactivate_stylist(self):
         """Deactivate a stylist."""
         try:
-            stylist_id = int(input("\nEnter Stylist ID to deactivate: ").strip())
-            stylist = Stylist.find_by_id(self.session, stylist_id)
+            stylist_id = self._prompt_id("\nEnter Stylist ID to deactivate: ")
+            stylist = self._get_stylist(stylist_id)
             
             if not stylist:
                 print(f"No stylist found with ID {stylist_id}")
@@ -687,58 +1113,79 @@ class SalonProCLI:
             self.display_stylist_details(stylist)
             
             # Ask for confirmation
-            confirm = input(f"\nAre you sure you want to deactivate {stylist.full_name}? (yes/no): ").strip().lower()
+            confirm = self._prompt(f"\nAre you sure you want to deactivate {stylist.full_name}? (yes/no): ").lower()
             
             if confirm == 'yes':
                 # Check if stylist has upcoming appointments
-                appointments = stylist.get_appointments(self.session)
-                upcoming = [app for app in appointments if app.is_upcoming]
-                
-                if upcoming:
-                    print(f"Cannot deactivate stylist with {len(upcoming)} upcoming appointment(s).")
+                if Stylist.has_upcoming_appointments(self.session, stylist.id):
+                    upcoming = Stylist.count_upcoming_appointments(self.session, stylist.id)
+                    print(f"Cannot deactivate stylist with {upcoming} upcoming appointment(s).")
                     print("   Please cancel or reassign appointments first.")
                     return
                 
-                stylist.is_active = 0
+                stylist.is_active = False
                 self.session.commit()
+                self._invalidate_pick_list('stylists')
                 print(f"Stylist {stylist.full_name} deactivated successfully!")
             else:
                 print("Deactivation cancelled.")
                 
         except ValueError:
             print("Please enter a valid number.")
+    
+    def bulk_deactivate_stylists(self):
+        """Deactivate several stylists in one step."""
+        try:
+            raw = self._prompt("\nEnter Stylist IDs to deactivate (comma-separated): ")
+            stylist_ids = {int(part) for part in raw.split(",") if part.strip()}
+        except ValueError:
+            print("Please enter valid numbers.")
+            return
+        
+        if not stylist_ids:
+            print("No stylist IDs entered.")
+            return
+        
+        # Same rule as single deactivation: stylists with upcoming work stay active
+        blocked = Stylist.ids_with_upcoming_appointments(self.session, stylist_ids)
+        for stylist_id in sorted(blocked):
+            print(f"Stylist {stylist_id} has upcoming appointments and was skipped.")
+        stylist_ids -= blocked
+        
+        if not stylist_ids:
+            print("No stylists to deactivate.")
+            return
+        
+        id_list = ", ".join(str(stylist_id) for stylist_id in sorted(stylist_ids))
+        confirm = self._prompt(f"\nDeactivate stylist(s) {id_list}? (yes/no): ").lower()
+        if confirm != 'yes':
+            print("Deactivation cancelled.")
+            return
+        
+        count = Stylist.bulk_deactivate(self.session, stylist_ids)
+        self._invalidate_pick_list('stylists')
+        print(f"{count} stylist(s) deactivated successfully!")
     # ========== SERVICE MANAGEMENT METHODS ==========
     
     def handle_service_management(self):
         """Handle service management operations."""
         while True:
             self.service_management_menu()
-            choice = input("\nEnter your choice (1-9): ").strip()
+            choice = self._prompt("\nEnter your choice (1-9): ")
             
             if choice == "9":
                 break
-            elif choice == "1":
-                self.view_all_services()
-            elif choice == "2":
-                self.view_service_menu()
-            elif choice == "3":
-                self.add_new_service()
-            elif choice == "4":
-                self.find_service_by_id()
-            elif choice == "5":
-                self.find_service_by_category()
-            elif choice == "6":
-                self.update_service()
-            elif choice == "7":
-                self.view_service_popularity()
-            elif choice == "8":
-                self.deactivate_service()
+
+            handler = self._service_dispatch.get(choice)
+            if handler:
+                handler()
             else:
                 print("Invalid choice. Please enter a number between 1-9.")
     
     def view_all_services(self):
         """Display all services."""
-        services = Service.get_all(self.session)
+        # Only the listed columns are selected, so no Service objects are built
+        services = Service.get_summary(self.session)
         if not services:
             print("\nNo services found.")
             return
@@ -748,24 +1195,37 @@ class SalonProCLI:
         print(f"{'ID':<5} {'Name':<25} {'Category':<15} {'Duration':<12} {'Price':<10} {'Status':<10}")
         print("-" * 90)
         
-        for service in services:
-            status = "Active" if service.is_active else "Inactive"
-            print(f"{service.id:<5} {service.name:<25} {service.category or 'N/A':<15} {service.formatted_duration:<12} {service.formatted_price:<10} {status:<10}")
+        sys.stdout.write("".join(
+            f"{service.id:<5} {service.name:<25} {service.category or 'N/A':<15} {format_duration(service.duration_minutes):<12} {format_price(service.price):<10} {'Active' if service.is_active else 'Inactive':<10}\n"
+            for service in services
+        ))
     
     def view_service_menu(self):
         """Display active services only (menu for clients)."""
-        services = Service.get_active(self.session)
+        if self._service_menu_text is None:
+            self._service_menu_text = self._render_service_menu()
+        sys.stdout.write(self._service_menu_text)
+    
+    def _render_service_menu(self):
+        """Build the active-service menu text."""
+        services = Service.get_summary(self.session, active_only=True)
         if not services:
-            print("\nNo active services found.")
-            return
-        
-        print(f"\nSERVICE MENU ({len(services)} active services)")
-        print("-" * 80)
-        print(f"{'ID':<5} {'Name':<25} {'Category':<15} {'Duration':<12} {'Price':<10}")
-        print("-" * 80)
+            return "\nNo active services found.\n"
         
+        lines = [
+            f"\nSERVICE MENU ({len(services)} active services)",
+            "-" * 80,
+            f"{'ID':<5} {'Name':<25} {'Category':<15} {'Duration':<12} {'Price':<10}",
+            "-" * 80,
+        ]
         for service in services:
-            print(f"{service.id:<5} {service.name:<25} {service.category or 'N/A':<15} {service.formatted_duration:<12} {service.formatted_price:<10}")
+            lines.append(f"{service.id:<5} {service.name:<25} {service.category or 'N/A':<15} {format_duration(service.duration_minutes):<12} {format_price(service.price):<10}")
+        return "\n".join(lines) + "\n"
+    
+    def _invalidate_service_menu(self):
+        """Force the next service menu display to re-read the services."""
+        self._service_menu_text = None
+        self._invalidate_pick_list('services')
     
     def add_new_service(self):
         """Add a new service to the database."""
@@ -773,11 +1233,11 @@ class SalonProCLI:
         print("-" * 40)
         
         try:
-            name = input("Service Name: ").strip()
-            category = input("Category (e.g., Haircut, Color): ").strip()
-            duration = input("Duration in minutes: ").strip()
-            price = input("Price: ").strip()
-            description = input("Description (optional): ").strip() or None
+            name = self._prompt("Service Name: ")
+            category = self._prompt("Category (e.g., Haircut, Color): ")
+            duration = self._prompt("Duration in minutes: ")
+            price = self._prompt("Price: ")
+            description = self._prompt("Description (optional): ") or None
             
             if not name or not category or not duration or not price:
                 print("Service name, category, duration, and price are required.")
@@ -791,20 +1251,22 @@ class SalonProCLI:
                 print("Duration must be a whole number and price must be a number.")
                 return
             
-            # Check if service name already exists
-            existing = self.session.query(Service).filter_by(name=name).first()
-            if existing:
-                print(f"Service '{name}' already exists (ID: {existing.id})")
+            # The unique constraint on name rejects duplicates, so there is
+            # no separate lookup before the insert
+            try:
+                service = Service.create(
+                    session=self.session,
+                    name=name,
+                    description=description,
+                    duration_minutes=duration,
+                    price=price,
+                    category=category
+                )
+            except IntegrityError:
+                self.session.rollback()
+                print(f"Service '{name}' already exists (ID: {Service.find_id_by_name(self.session, name)})")
                 return
-            
-            service = Service.create(
-                session=self.session,
-                name=name,
-                description=description,
-                duration_minutes=duration,
-                price=price,
-                category=category
-            )
+            self._invalidate_service_menu()
             
             print(f"\nService added successfully!")
             print(f"   Name: {service.name}")
@@ -818,7 +1280,7 @@ class SalonProCLI:
     def find_service_by_id(self):
         """Find a service by its ID."""
         try:
-            service_id = int(input("\nEnter Service ID: ").strip())
+            service_id = self._prompt_id("\nEnter Service ID: ")
             service = Service.find_by_id(self.session, service_id)
             
             if service:
@@ -830,7 +1292,7 @@ class SalonProCLI:
     
     def find_service_by_category(self):
         """Find services by category."""
-        category = input("\nEnter category to search: ").strip()
+        category = self._prompt("\nEnter category to search: ")
         if not category:
             print("Please enter a category to search.")
             return
@@ -859,16 +1321,15 @@ class SalonProCLI:
         print(f"Price: {service.formatted_price}")
         print(f"Hourly Rate Equivalent: ${service.hourly_rate:.2f}/hr")
         print(f"Status: {'Active' if service.is_active else 'Inactive'}")
-        print(f"Created: {service.created_at.strftime('%Y-%m-%d')}")
+        print(f"Created: {service.created_at.isoformat()[:10]}")
         
         # Show appointment count
-        appointments = service.get_appointments(self.session)
-        print(f"Total Bookings: {len(appointments)}")
+        print(f"Total Bookings: {Service.count_appointments(self.session, service.id)}")
     
     def update_service(self):
         """Update service information."""
         try:
-            service_id = int(input("\nEnter Service ID to update: ").strip())
+            service_id = self._prompt_id("\nEnter Service ID to update: ")
             service = Service.find_by_id(self.session, service_id)
             
             if not service:
@@ -881,20 +1342,16 @@ class SalonProCLI:
             
             updates = {}
             
-            new_name = input(f"Service Name [{service.name}]: ").strip()
+            new_name = self._prompt(f"Service Name [{service.name}]: ")
             if new_name and new_name != service.name:
-                # Check if new name already exists
-                existing = self.session.query(Service).filter_by(name=new_name).first()
-                if existing and existing.id != service_id:
-                    print(f"Service '{new_name}' already exists (ID: {existing.id})")
-                    return
+                # A clash with another service's name is caught on save
                 updates['name'] = new_name
             
-            new_category = input(f"Category [{service.category}]: ").strip()
+            new_category = self._prompt(f"Category [{service.category}]: ")
             if new_category:
                 updates['category'] = new_category
             
-            new_duration = input(f"Duration [{service.duration_minutes} minutes]: ").strip()
+            new_duration = self._prompt(f"Duration [{service.duration_minutes} minutes]: ")
             if new_duration:
                 try:
                     updates['duration_minutes'] = int(new_duration)
@@ -902,7 +1359,7 @@ class SalonProCLI:
                     print("Duration must be a whole number.")
                     return
             
-            new_price = input(f"Price [${service.price:.2f}]: ").strip()
+            new_price = self._prompt(f"Price [${service.price:.2f}]: ")
             if new_price:
                 try:
                     updates['price'] = float(new_price.replace('$', ''))
@@ -910,12 +1367,19 @@ class SalonProCLI:
                     print("Price must be a number.")
                     return
             
-            new_desc = input(f"Description [{service.description or 'None'}]: ").strip()
+            new_desc = self._prompt(f"Description [{service.description or 'None'}]: ")
             if new_desc:
-                updates['description'] = new_desc if new_desc.lower() != 'none' else None
+                updates['description'] = _blank_if_none(new_desc)
             
             if updates:
-                Service.update(self.session, service_id, **updates)
+                try:
+                    Service.update(self.session, service_id, **updates)
+                except IntegrityError:
+                    self.session.rollback()
+                    new_name = updates['name']
+                    print(f"Service '{new_name}' already exists (ID: {Service.find_id_by_name(self.session, new_name)})")
+                    return
+                self._invalidate_service_menu()
                 print(f"\nService {service_id} updated successfully!")
             else:
                 print("\nNo changes made.")
@@ -927,40 +1391,28 @@ class SalonProCLI:
     
     def view_service_popularity(self):
         """View service popularity based on bookings."""
-        services = Service.get_all(self.session)
+        # Counts and revenue are aggregated per service in one grouped query,
+        # already sorted by total bookings
+        service_stats = Service.popularity_stats(self.session)
         
-        if not services:
+        if not service_stats:
             print("\nNo services found.")
             return
         
-        # Get appointment counts for each service
-        service_stats = []
-        for service in services:
-            appointments = service.get_appointments(self.session)
-            completed = [app for app in appointments if app.status == 'completed']
-            service_stats.append({
-                'service': service,
-                'total_bookings': len(appointments),
-                'completed_bookings': len(completed),
-                'revenue': sum(app.total_price for app in completed)
-            })
-        
-        # Sort by total bookings
-        service_stats.sort(key=lambda x: x['total_bookings'], reverse=True)
-        
         print(f"\nSERVICE POPULARITY REPORT")
         print("-" * 100)
         print(f"{'Rank':<6} {'Service':<25} {'Category':<15} {'Total Bookings':<15} {'Completed':<12} {'Revenue':<12}")
         print("-" * 100)
         
-        for i, stats in enumerate(service_stats, 1):
-            service = stats['service']
-            print(f"{i:<6} {service.name:<25} {service.category or 'N/A':<15} {stats['total_bookings']:<15} {stats['completed_bookings']:<12} ${stats['revenue']:<11.2f}")
+        lines = []
+        for i, (name, category, total_bookings, completed_bookings, revenue) in enumerate(service_stats, 1):
+            lines.append(f"{i:<6} {name:<25} {category or 'N/A':<15} {total_bookings:<15} {completed_bookings:<12} ${revenue:<11.2f}\n")
+        sys.stdout.write("".join(lines))
     
     def deactivate_service(self):
         """Deactivate a service."""
         try:
-            service_id = int(input("\nEnter Service ID to deactivate: ").strip())
+            service_id = self._prompt_id("\nEnter Service ID to deactivate: ")
             service = Service.find_by_id(self.session, service_id)
             
             if not service:
@@ -971,19 +1423,19 @@ class SalonProCLI:
             self.display_service_details(service)
             
             # Ask for confirmation
-            confirm = input(f"\nAre you sure you want to deactivate '{service.name}'? (yes/no): ").strip().lower()
+            confirm = self._prompt(f"\nAre you sure you want to deactivate '{service.name}'? (yes/no): ").lower()
             
             if confirm == 'yes':
                 # Check if service has upcoming appointments
-                appointments = service.get_appointments(self.session)
-                upcoming = [app for app in appointments if app.is_upcoming]
+                upcoming = Service.count_upcoming_appointments(self.session, service_id)
                 
                 if upcoming:
-                    print(f"Cannot deactivate service with {len(upcoming)} upcoming appointment(s).")
+                    print(f"Cannot deactivate service with {upcoming} upcoming appointment(s).")
                     print("   Please cancel or reassign appointments first.")
                     return
                 
                 if Service.delete(self.session, service_id):
+                    self._invalidate_service_menu()
                     print(f"Service '{service.name}' deactivated successfully!")
                 else:
                     print(f"Failed to deactivate service.")
@@ -999,67 +1451,65 @@ class SalonProCLI:
         """Handle appointment management operations."""
         while True:
             self.appointment_management_menu()
-            choice = input("\nEnter your choice (1-12): ").strip()
+            choice = self._prompt("\nEnter your choice (1-12): ")
+            self._now = datetime.now()
             
             if choice == "12":
                 break
-            elif choice == "1":
-                self.view_all_appointments()
-            elif choice == "2":
-                self.view_todays_appointments()
-            elif choice == "3":
-                self.view_upcoming_appointments()
-            elif choice == "4":
-                self.schedule_new_appointment()
-            elif choice == "5":
-                self.find_appointment_by_id()
-            elif choice == "6":
-                self.find_appointments_by_date()
-            elif choice == "7":
-                self.find_appointments_by_client()
-            elif choice == "8":
-                self.find_appointments_by_stylist()
-            elif choice == "9":
-                self.update_appointment_status()
-            elif choice == "10":
-                self.cancel_appointment()
-            elif choice == "11":
-                self.delete_appointment()
+
+            handler = self._appointment_dispatch.get(choice)
+            if handler:
+                handler()
             else:
                 print("Invalid choice. Please enter a number between 1-12.")
     
     def view_all_appointments(self):
-        """Display all appointments."""
-        appointments = Appointment.get_all(self.session)
-        if not appointments:
+        """Display all appointments, newest first, a page at a time."""
+        total = Appointment.count_all(self.session)
+        if not total:
             print("\nNo appointments found.")
             return
         
-        print(f"\nALL APPOINTMENTS ({len(appointments)} total)")
+        print(f"\nALL APPOINTMENTS ({total} total)")
         print("-" * 120)
         print(f"{'ID':<5} {'Date':<12} {'Time':<10} {'Client':<20} {'Stylist':<20} {'Service':<20} {'Status':<12} {'Price':<10}")
         print("-" * 120)
         
-        for app in sorted(appointments, key=lambda x: x.appointment_date, reverse=True):
-            client_name = app.client.full_name if app.client else "N/A"
-            stylist_name = app.stylist.full_name if app.stylist else "N/A"
-            service_name = app.service.name if app.service else "N/A"
-            print(f"{app.id:<5} {app.date_only:<12} {app.time_only:<10} {client_name:<20} {stylist_name:<20} {service_name:<20} {app.status:<12} ${app.total_price:<9.2f}")
+        shown = 0
+        while True:
+            rows = Appointment.report_rows(
+                self.session, newest_first=True, limit=_APPOINTMENT_PAGE_SIZE, offset=shown
+            )
+            # Rows are collected and written with one call instead of a print per row
+            sys.stdout.write("".join(
+                f"{row.id:<5} {format_date(row.appointment_date):<12} {format_time(row.appointment_date):<10} {row.client_name or 'N/A':<20} {row.stylist_name or 'N/A':<20} {row.service_name or 'N/A':<20} {row.status:<12} {_price_cell(row.total_price)}\n"
+                for row in rows
+            ))
+            
+            shown += len(rows)
+            if not rows or shown >= total:
+                break
+            more = self._prompt(f"\nShowing {shown} of {total}. Press Enter for more, or 'q' to stop: ")
+            if more.lower() == 'q':
+                break
     
     def view_todays_appointments(self):
         """Display today's appointments."""
-        today = date.today()
-        appointments = Appointment.find_by_date(self.session, today)
-        
-        if not appointments:
-            print("\nNo appointments scheduled for today.")
-            return
-        
-        # Filter for scheduled appointments only
-        todays_apps = [app for app in appointments if app.status == 'scheduled']
+        today = self._now.date()
+        todays_apps = Appointment.report_rows(
+            self.session,
+            start=datetime.combine(today, time.min),
+            end=datetime.combine(today, time.max),
+            status='scheduled'
+        )
         
         if not todays_apps:
-            print(f"\nNo scheduled appointments for today ({len(appointments) - len(todays_apps)} cancelled/completed)")
+            # Cancelled/completed ones are only counted when there is nothing to list
+            other_count = Appointment.count_by_date(self.session, today)
+            if not other_count:
+                print("\nNo appointments scheduled for today.")
+            else:
+                print(f"\nNo scheduled appointments for today ({other_count} cancelled/completed)")
             return
         
         print(f"\nTODAY'S APPOINTMENTS ({len(todays_apps)} scheduled)")
@@ -1067,15 +1517,14 @@ class SalonProCLI:
         print(f"{'Time':<10} {'Client':<20} {'Stylist':<20} {'Service':<25} {'Duration':<10} {'Price':<10}")
         print("-" * 100)
         
-        for app in sorted(todays_apps, key=lambda x: x.appointment_date):
-            client_name = app.client.full_name if app.client else "N/A"
-            stylist_name = app.stylist.full_name if app.stylist else "N/A"
-            service_name = app.service.name if app.service else "N/A"
-            print(f"{app.time_only:<10} {client_name:<20} {stylist_name:<20} {service_name:<25} {app.duration_minutes} min{'':<5} ${app.total_price:<9.2f}")
+        sys.stdout.write("".join(
+            f"{format_time(row.appointment_date):<10} {row.client_name or 'N/A':<20} {row.stylist_name or 'N/A':<20} {row.service_name or 'N/A':<25} {row.duration_minutes} min{'':<5} {_price_cell(row.total_price)}\n"
+            for row in todays_apps
+        ))
     
     def view_upcoming_appointments(self):
         """Display all upcoming appointments."""
-        appointments = Appointment.find_upcoming(self.session)
+        appointments = Appointment.report_rows(self.session, start=self._now, status='scheduled')
         
         if not appointments:
             print("\nNo upcoming appointments.")
@@ -1086,11 +1535,40 @@ class SalonProCLI:
         print(f"{'Date':<12} {'Time':<10} {'Client':<20} {'Stylist':<20} {'Service':<25} {'Duration':<10} {'Price':<10}")
         print("-" * 110)
         
-        for app in sorted(appointments, key=lambda x: x.appointment_date):
-            client_name = app.client.full_name if app.client else "N/A"
-            stylist_name = app.stylist.full_name if app.stylist else "N/A"
-            service_name = app.service.name if app.service else "N/A"
-            print(f"{app.date_only:<12} {app.time_only:<10} {client_name:<20} {stylist_name:<20} {service_name:<25} {app.duration_minutes} min{'':<5} ${app.total_price:<9.2f}")
+        sys.stdout.write("".join(
+            f"{format_date(row.appointment_date):<12} {format_time(row.appointment_date):<10} {row.client_name or 'N/A':<20} {row.stylist_name or 'N/A':<20} {row.service_name or 'N/A':<25} {row.duration_minutes} min{'':<5} {_price_cell(row.total_price)}\n"
+            for row in appointments
+        ))
+    
+    def _pick_list(self, kind):
+        """Return the rendered 'clients', 'stylists' or 'services' pick list, rebuilding it after a change."""
+        text = self._pick_lists.get(kind)
+        if text is None:
+            text = self._pick_lists[kind] = self._render_pick_list(kind)
+        return text
+    
+    def _render_pick_list(self, kind):
+        """Build a pick list's text; empty when there is nothing to pick."""
+        if kind == 'clients':
+            lines = [
+                f"  {client_id}. {first_name} {last_name}\n"
+                for client_id, first_name, last_name in Client.get_names(self.session, limit=_PICK_LIST_CLIENTS)
+            ]
+        elif kind == 'stylists':
+            lines = [
+                f"  {stylist.id}. {stylist.full_name} ({stylist.specialty})\n"
+                for stylist in Stylist.get_active(self.session)
+            ]
+        else:
+            lines = [
+                f"  {service.id}. {service.name} (${service.price}, {service.duration_minutes}min)\n"
+                for service in Service.get_summary(self.session, active_only=True)
+            ]
+        return "".join(lines)
+    
+    def _invalidate_pick_list(self, kind):
+        """Force the next scheduling prompt to re-read a pick list."""
+        self._pick_lists.pop(kind, None)
     
     def schedule_new_appointment(self):
         """Schedule a new appointment."""
@@ -1099,56 +1577,53 @@ class SalonProCLI:
         
         try:
             # Show available clients
-            clients = Client.get_all(self.session)
+            clients = self._pick_list('clients')
             if not clients:
                 print("No clients available. Please add a client first.")
                 return
             
             print("\nAvailable Clients:")
-            for client in clients[:10]:  # Show first 10
-                print(f"  {client.id}. {client.full_name}")
+            sys.stdout.write(clients)
             
-            client_id = int(input("\nSelect Client ID: ").strip())
-            client = Client.find_by_id(self.session, client_id)
+            client_id = self._prompt_id("\nSelect Client ID: ")
+            client = self._get_client(client_id)
             if not client:
                 print(f"No client found with ID {client_id}")
                 return
             
             # Show available stylists
-            stylists = Stylist.get_active(self.session)
+            stylists = self._pick_list('stylists')
             if not stylists:
                 print("No active stylists available. Please add a stylist first.")
                 return
             
             print("\nAvailable Stylists:")
-            for stylist in stylists:
-                print(f"  {stylist.id}. {stylist.full_name} ({stylist.specialty})")
+            sys.stdout.write(stylists)
             
-            stylist_id = int(input("\nSelect Stylist ID: ").strip())
-            stylist = Stylist.find_by_id(self.session, stylist_id)
+            stylist_id = self._prompt_id("\nSelect Stylist ID: ")
+            stylist = self._get_stylist(stylist_id)
             if not stylist or not stylist.is_active:
                 print(f"No active stylist found with ID {stylist_id}")
                 return
             
             # Show available services
-            services = Service.get_active(self.session)
+            services = self._pick_list('services')
             if not services:
                 print("No active services available. Please add a service first.")
                 return
             
             print("\nAvailable Services:")
-            for service in services:
-                print(f"  {service.id}. {service.name} (${service.price}, {service.duration_minutes}min)")
+            sys.stdout.write(services)
             
-            service_id = int(input("\nSelect Service ID: ").strip())
+            service_id = self._prompt_id("\nSelect Service ID: ")
             service = Service.find_by_id(self.session, service_id)
             if not service or not service.is_active:
                 print(f"No active service found with ID {service_id}")
                 return
             
             # Get appointment date and time
-            date_str = input("Appointment Date (YYYY-MM-DD): ").strip()
-            time_str = input("Appointment Time (HH:MM in 24-hour format): ").strip()
+            date_str = self._prompt("Appointment Date (YYYY-MM-DD): ")
+            time_str = self._prompt("Appointment Time (HH:MM in 24-hour format): ")
             
             if not date_str or not time_str:
                 print("Date and time are required.")
@@ -1156,24 +1631,17 @@ class SalonProCLI:
             
             # Parse date and time
             try:
-                year, month, day = map(int, date_str.split('-'))
-                hour, minute = map(int, time_str.split(':'))
-                appointment_datetime = datetime(year, month, day, hour, minute)
+                appointment_datetime = _parse_datetime(date_str, time_str)
             except ValueError:
                 print("Invalid date or time format.")
                 return
             
-            # Check if appointment is in the past
-            if appointment_datetime < datetime.now():
-                print("Cannot schedule appointments in the past.")
+            problem = self._check_appointment_time(appointment_datetime)
+            if problem:
+                print(problem)
                 return
             
-            # Check business hours (9 AM to 6 PM)
-            if hour < 9 or hour >= 18:
-                print("Appointments can only be scheduled between 9 AM and 6 PM.")
-                return
-            
-            notes = input("Notes (optional): ").strip() or None
+            notes = self._prompt("Notes (optional): ") or None
             
             # Create the appointment
             appointment = Appointment.create(
@@ -1201,10 +1669,84 @@ class SalonProCLI:
         except Exception as e:
             print(f"Error scheduling appointment: {e}")
     
+    def _check_appointment_time(self, appointment_datetime):
+        """Return why an appointment cannot be booked at this time, or None if it can."""
+        # Read now, not at the menu choice: the user may have sat at the prompts
+        now = datetime.now()
+        if appointment_datetime < now:
+            return "Cannot schedule appointments in the past."
+        
+        # Business hours are 9 AM to 6 PM
+        if appointment_datetime.hour < 9 or appointment_datetime.hour >= 18:
+            return "Appointments can only be scheduled between 9 AM and 6 PM."
+        return None
+    
+    def _appointment_fields(self, client_id, stylist_id, service_id, appointment_datetime, notes=None):
+        """Validate a booking without prompting and return its column values; raises ValueError if it cannot be booked."""
+        if not self._get_client(client_id):
+            raise ValueError(f"No client found with ID {client_id}")
+        stylist = self._get_stylist(stylist_id)
+        if not stylist or not stylist.is_active:
+            raise ValueError(f"No active stylist found with ID {stylist_id}")
+        service = Service.find_by_id(self.session, service_id)
+        if not service or not service.is_active:
+            raise ValueError(f"No active service found with ID {service_id}")
+        problem = self._check_appointment_time(appointment_datetime)
+        if problem:
+            raise ValueError(problem)
+        
+        return dict(
+            client_id=client_id,
+            stylist_id=stylist_id,
+            service_id=service_id,
+            appointment_date=appointment_datetime,
+            duration_minutes=service.duration_minutes,
+            total_price=service.price,
+            notes=notes
+        )
+    
+    def import_appointments(self, path):
+        """Schedule every appointment listed in a CSV file with one INSERT and one commit.
+        
+        The file needs a header row with client_id, stylist_id, service_id,
+        date (YYYY-MM-DD) and time (HH:MM) columns, plus an optional notes
+        column. Rows that cannot be booked are reported and skipped. Returns
+        False, scheduling nothing, if the file itself cannot be read.
+        """
+        rows, line_numbers, problems = [], [], []
+        try:
+            with open(path, newline='') as csv_file:
+                for line_number, row in enumerate(csv.DictReader(csv_file), 2):
+                    try:
+                        rows.append(self._appointment_fields(
+                            int(row['client_id']),
+                            int(row['stylist_id']),
+                            int(row['service_id']),
+                            _parse_datetime(row['date'], row['time']),
+                            notes=(row.get('notes') or '').strip() or None
+                        ))
+                    except (KeyError, TypeError, ValueError) as e:
+                        problems.append((line_number, str(e)))
+                        continue
+                    line_numbers.append(line_number)
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            print(f"Cannot read {path}: {e}", file=sys.stderr)
+            return False
+        
+        appointments, conflicts = Appointment.create_many(self.session, rows)
+        problems.extend(
+            (line_numbers[index], "Scheduling conflict! Stylist is already booked at this time.")
+            for index in conflicts
+        )
+        for line_number, problem in sorted(problems):
+            print(f"Line {line_number} skipped: {problem}")
+        print(f"{len(appointments)} appointment(s) scheduled.")
+        return True
+    
     def find_appointment_by_id(self):
         """Find an appointment by its ID."""
         try:
-            appointment_id = int(input("\nEnter Appointment ID: ").strip())
+            appointment_id = self._prompt_id("\nEnter Appointment ID: ")
             appointment = Appointment.find_by_id(self.session, appointment_id)
             
             if appointment:
@@ -1216,19 +1758,22 @@ class SalonProCLI:
     
     def find_appointments_by_date(self):
         """Find appointments on a specific date."""
-        date_str = input("\nEnter date (YYYY-MM-DD): ").strip()
+        date_str = self._prompt("\nEnter date (YYYY-MM-DD): ")
         if not date_str:
             print("Please enter a date.")
             return
         
         try:
-            year, month, day = map(int, date_str.split('-'))
-            search_date = date(year, month, day)
+            search_date = _parse_date(date_str)
         except ValueError:
             print("Invalid date format. Use YYYY-MM-DD.")
             return
         
-        appointments = Appointment.find_by_date(self.session, search_date)
+        appointments = Appointment.report_rows(
+            self.session,
+            start=datetime.combine(search_date, time.min),
+            end=datetime.combine(search_date, time.max)
+        )
         
         if not appointments:
             print(f"\nNo appointments found on {date_str}")
@@ -1239,23 +1784,22 @@ class SalonProCLI:
         print(f"{'Time':<10} {'Client':<20} {'Stylist':<20} {'Service':<25} {'Status':<12} {'Price':<10}")
         print("-" * 100)
         
-        for app in sorted(appointments, key=lambda x: x.appointment_date):
-            client_name = app.client.full_name if app.client else "N/A"
-            stylist_name = app.stylist.full_name if app.stylist else "N/A"
-            service_name = app.service.name if app.service else "N/A"
-            print(f"{app.time_only:<10} {client_name:<20} {stylist_name:<20} {service_name:<25} {app.status:<12} ${app.total_price:<9.2f}")
+        sys.stdout.write("".join(
+            f"{format_time(row.appointment_date):<10} {row.client_name or 'N/A':<20} {row.stylist_name or 'N/A':<20} {row.service_name or 'N/A':<25} {row.status:<12} {_price_cell(row.total_price)}\n"
+            for row in appointments
+        ))
     
     def find_appointments_by_client(self):
         """Find appointments for a specific client."""
         try:
-            client_id = int(input("\nEnter Client ID: ").strip())
-            client = Client.find_by_id(self.session, client_id)
+            client_id = self._prompt_id("\nEnter Client ID: ")
+            client = self._get_client(client_id)
             
             if not client:
                 print(f"No client found with ID {client_id}")
                 return
             
-            appointments = Appointment.find_by_client(self.session, client_id)
+            appointments = Appointment.report_rows(self.session, client_id=client_id, newest_first=True)
             
             if not appointments:
                 print(f"\nNo appointments found for {client.full_name}")
@@ -1266,10 +1810,10 @@ class SalonProCLI:
             print(f"{'Date':<12} {'Time':<10} {'Stylist':<20} {'Service':<25} {'Status':<12} {'Price':<10}")
             print("-" * 100)
             
-            for app in sorted(appointments, key=lambda x: x.appointment_date, reverse=True):
-                stylist_name = app.stylist.full_name if app.stylist else "N/A"
-                service_name = app.service.name if app.service else "N/A"
-                print(f"{app.date_only:<12} {app.time_only:<10} {stylist_name:<20} {service_name:<25} {app.status:<12} ${app.total_price:<9.2f}")
+            sys.stdout.write("".join(
+                f"{format_date(row.appointment_date):<12} {format_time(row.appointment_date):<10} {row.stylist_name or 'N/A':<20} {row.service_name or 'N/A':<25} {row.status:<12} {_price_cell(row.total_price)}\n"
+                for row in appointments
+            ))
                 
         except ValueError:
             print("Please enter a valid number.")
@@ -1277,14 +1821,14 @@ class SalonProCLI:
     def find_appointments_by_stylist(self):
         """Find appointments for a specific stylist."""
         try:
-            stylist_id = int(input("\nEnter Stylist ID: ").strip())
-            stylist = Stylist.find_by_id(self.session, stylist_id)
+            stylist_id = self._prompt_id("\nEnter Stylist ID: ")
+            stylist = self._get_stylist(stylist_id)
             
             if not stylist:
                 print(f"No stylist found with ID {stylist_id}")
                 return
             
-            appointments = Appointment.find_by_stylist(self.session, stylist_id)
+            appointments = Appointment.report_rows(self.session, stylist_id=stylist_id, newest_first=True)
             
             if not appointments:
                 print(f"\nNo appointments found for {stylist.full_name}")
@@ -1295,10 +1839,10 @@ class SalonProCLI:
             print(f"{'Date':<12} {'Time':<10} {'Client':<20} {'Service':<25} {'Status':<12} {'Price':<10}")
             print("-" * 100)
             
-            for app in sorted(appointments, key=lambda x: x.appointment_date, reverse=True):
-                client_name = app.client.full_name if app.client else "N/A"
-                service_name = app.service.name if app.service else "N/A"
-                print(f"{app.date_only:<12} {app.time_only:<10} {client_name:<20} {service_name:<25} {app.status:<12} ${app.total_price:<9.2f}")
+            sys.stdout.write("".join(
+                f"{format_date(row.appointment_date):<12} {format_time(row.appointment_date):<10} {row.client_name or 'N/A':<20} {row.service_name or 'N/A':<25} {row.status:<12} {_price_cell(row.total_price)}\n"
+                for row in appointments
+            ))
                 
         except ValueError:
             print("Please enter a valid number.")
@@ -1313,7 +1857,7 @@ class SalonProCLI:
         print(f"Status: {appointment.status}")
         print(f"Price: ${appointment.total_price:.2f}")
         print(f"Notes: {appointment.notes or 'None'}")
-        print(f"Created: {appointment.created_at.strftime('%Y-%m-%d %H:%M')}")
+        print(f"Created: {appointment.created_at.isoformat(' ')[:16]}")
         
         # Client information
         if appointment.client:
@@ -1340,7 +1884,7 @@ class SalonProCLI:
     def update_appointment_status(self):
         """Update appointment status."""
         try:
-            appointment_id = int(input("\nEnter Appointment ID: ").strip())
+            appointment_id = self._prompt_id("\nEnter Appointment ID: ")
             appointment = Appointment.find_by_id(self.session, appointment_id)
             
             if not appointment:
@@ -1352,15 +1896,14 @@ class SalonProCLI:
             print("-" * 40)
             print("Available statuses: scheduled, completed, cancelled, no-show")
             
-            new_status = input(f"New Status [{appointment.status}]: ").strip().lower()
+            new_status = self._prompt(f"New Status [{appointment.status}]: ").lower()
             if not new_status:
                 print("No change made.")
                 return
             
             # Validate status
-            valid_statuses = ['scheduled', 'completed', 'cancelled', 'no-show']
-            if new_status not in valid_statuses:
-                print(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
+            if new_status not in Appointment.STATUSES:
+                print(f"Invalid status. Must be one of: {', '.join(Appointment.STATUSES)}")
                 return
             
             # Update the appointment
@@ -1377,7 +1920,7 @@ class SalonProCLI:
     def cancel_appointment(self):
         """Cancel an appointment."""
         try:
-            appointment_id = int(input("\nEnter Appointment ID to cancel: ").strip())
+            appointment_id = self._prompt_id("\nEnter Appointment ID to cancel: ")
             appointment = Appointment.find_by_id(self.session, appointment_id)
             
             if not appointment:
@@ -1392,7 +1935,7 @@ class SalonProCLI:
                 return
             
             # Ask for confirmation
-            confirm = input(f"\nAre you sure you want to cancel this appointment? (yes/no): ").strip().lower()
+            confirm = self._prompt(f"\nAre you sure you want to cancel this appointment? (yes/no): ").lower()
             
             if confirm == 'yes':
                 if Appointment.cancel(self.session, appointment_id):
@@ -1408,7 +1951,7 @@ class SalonProCLI:
     def delete_appointment(self):
         """Delete an appointment."""
         try:
-            appointment_id = int(input("\nEnter Appointment ID to delete: ").strip())
+            appointment_id = self._prompt_id("\nEnter Appointment ID to delete: ")
             appointment = Appointment.find_by_id(self.session, appointment_id)
             
             if not appointment:
@@ -1419,7 +1962,7 @@ class SalonProCLI:
             self.display_appointment_details(appointment)
             
             # Ask for confirmation
-            confirm = input(f"\nAre you sure you want to DELETE this appointment? This cannot be undone. (yes/no): ").strip().lower()
+            confirm = self._prompt(f"\nAre you sure you want to DELETE this appointment? This cannot be undone. (yes/no): ").lower()
             
             if confirm == 'yes':
                 if Appointment.delete(self.session, appointment_id):
@@ -1436,120 +1979,93 @@ class SalonProCLI:
     
     def handle_reports(self):
         """Handle reports and analytics."""
-        print("\nREPORTS & ANALYTICS")
-        print("-" * 40)
-        print("1. Daily Revenue Report")
-        print("2. Client Count Report")
-        print("3. Stylist Performance Report")
-        print("4. Service Popularity Report")
-        print("5. Back to Main Menu")
-        print("-" * 40)
+        sys.stdout.write(_REPORTS_MENU)
+        
+        choice = self._prompt("\nEnter your choice (1-5): ")
         
-        choice = input("\nEnter your choice (1-5): ").strip()
-        
-        if choice == "1":
-            self.daily_revenue_report()
-        elif choice == "2":
-            self.client_count_report()
-        elif choice == "3":
-            self.stylist_performance_report()
-        elif choice == "4":
-            self.view_service_popularity()  # Already implemented
-        elif choice == "5":
+        if choice == "5":
             return
+        
+        handler = self._reports_dispatch.get(choice)
+        if handler:
+            handler()
         else:
             print("Invalid choice.")
     
     def daily_revenue_report(self):
         """Generate daily revenue report."""
-        date_str = input("\nEnter date for report (YYYY-MM-DD): ").strip()
+        date_str = self._prompt("\nEnter date for report (YYYY-MM-DD): ")
         if not date_str:
             print("Please enter a date.")
             return
         
         try:
-            year, month, day = map(int, date_str.split('-'))
-            report_date = date(year, month, day)
+            report_date = _parse_date(date_str)
         except ValueError:
             print("Invalid date format. Use YYYY-MM-DD.")
             return
         
-        # Get appointments for the date
-        appointments = Appointment.find_by_date(self.session, report_date)
-        completed_appointments = [app for app in appointments if app.status == 'completed']
+        # Counts and revenue are aggregated in SQL; no appointment rows are loaded
+        total_count, completed_count, total_revenue = Appointment.day_summary(self.session, report_date)
         
         print(f"\nDAILY REVENUE REPORT - {date_str}")
         print("=" * 60)
-        print(f"Total Appointments: {len(appointments)}")
-        print(f"Completed Appointments: {len(completed_appointments)}")
-        print(f"Cancelled/No-Show: {len(appointments) - len(completed_appointments)}")
+        print(f"Total Appointments: {total_count}")
+        print(f"Completed Appointments: {completed_count}")
+        print(f"Cancelled/No-Show: {total_count - completed_count}")
         
-        if completed_appointments:
-            total_revenue = sum(app.total_price for app in completed_appointments)
+        if completed_count:
             print(f"\nTotal Revenue: ${total_revenue:.2f}")
             
             print(f"\nBreakdown by Service:")
             print("-" * 50)
             
-            # Group by service
-            service_revenue = {}
-            for app in completed_appointments:
-                if app.service:
-                    service_name = app.service.name
-                    service_revenue[service_name] = service_revenue.get(service_name, 0) + app.total_price
-            
-            for service_name, revenue in sorted(service_revenue.items(), key=lambda x: x[1], reverse=True):
+            service_revenue = Appointment.revenue_by_service(
+                self.session,
+                datetime.combine(report_date, time.min),
+                datetime.combine(report_date, time.max)
+            )
+            for service_name, revenue in service_revenue:
                 print(f"  {service_name}: ${revenue:.2f}")
         else:
             print(f"\nTotal Revenue: $0.00")
     
     def client_count_report(self):
         """Generate client count report."""
-        clients = Client.get_all(self.session)
+        total_clients = Client.count_all(self.session)
         
         print(f"\nCLIENT COUNT REPORT")
         print("=" * 60)
-        print(f"Total Clients: {len(clients)}")
-        
-        # Count clients with appointments
-        clients_with_appointments = 0
-        total_appointments = 0
-        appointment_counts = []
+        print(f"Total Clients: {total_clients}")
         
-        for client in clients:
-            appointments = client.get_appointments(self.session)
-            if appointments:
-                clients_with_appointments += 1
-                total_appointments += len(appointments)
-                appointment_counts.append(len(appointments))
+        # Per-client appointment counts are grouped and summarised in SQL
+        clients_with_appointments, total_appointments, most, fewest = Client.appointment_stats(self.session)
         
         print(f"Clients with Appointments: {clients_with_appointments}")
-        print(f"Clients without Appointments: {len(clients) - clients_with_appointments}")
+        print(f"Clients without Appointments: {total_clients - clients_with_appointments}")
         print(f"Total Appointments: {total_appointments}")
         
-        if appointment_counts:
+        if clients_with_appointments:
             avg_appointments = total_appointments / clients_with_appointments
             print(f"Average Appointments per Client: {avg_appointments:.1f}")
-            print(f"Most Appointments by a Client: {max(appointment_counts)}")
-            print(f"Least Appointments by a Client: {min(appointment_counts)}")
+            print(f"Most Appointments by a Client: {most}")
+            print(f"Least Appointments by a Client: {fewest}")
     
     def stylist_performance_report(self):
         """Generate stylist performance report."""
-        stylists = Stylist.get_all(self.session)
+        # Totals, completions and revenue are aggregated per stylist in one query
+        stylist_stats = Stylist.performance_stats(self.session)
         
         print(f"\nSTYLIST PERFORMANCE REPORT")
         print("=" * 80)
         print(f"{'Name':<20} {'Specialty':<15} {'Total Appts':<12} {'Completed':<12} {'Revenue':<12} {'Avg/Appt':<12}")
         print("=" * 80)
         
-        for stylist in stylists:
-            appointments = stylist.get_appointments(self.session)
-            completed = [app for app in appointments if app.status == 'completed']
-            revenue = sum(app.total_price for app in completed)
-            
-            avg_revenue = revenue / len(completed) if completed else 0
-            
-            print(f"{stylist.full_name:<20} {stylist.specialty or 'N/A':<15} {len(appointments):<12} {len(completed):<12} ${revenue:<11.2f} ${avg_revenue:<11.2f}")
+        lines = []
+        for first_name, last_name, specialty, total, completed, revenue in stylist_stats:
+            avg_revenue = revenue / completed if completed else 0
+            lines.append(f"{first_name + ' ' + last_name:<20} {specialty or 'N/A':<15} {total:<12} {completed:<12} ${revenue:<11.2f} ${avg_revenue:<11.2f}\n")
+        sys.stdout.write("".join(lines))
     
     # ========== SEARCH METHODS ==========
     
@@ -1557,88 +2073,84 @@ class SalonProCLI:
         """Handle search operations."""
         while True:
             self.search_menu()
-            choice = input("\nEnter your choice (1-4): ").strip()
+            choice = self._prompt("\nEnter your choice (1-4): ")
             
             if choice == "4":
                 break
-            elif choice == "1":
-                self.search_clients()
-            elif choice == "2":
-                self.search_appointments_by_date_range()
-            elif choice == "3":
-                self.search_revenue_by_date()
+
+            handler = self._search_dispatch.get(choice)
+            if handler:
+                handler()
             else:
                 print("Invalid choice. Please enter a number between 1-4.")
     
     def search_clients(self):
         """Search clients by various criteria."""
-        print("\nSEARCH CLIENTS")
-        print("-" * 40)
-        print("1. By Name")
-        print("2. By Phone")
-        print("3. By Email")
-        print("4. Back to Search Menu")
-        print("-" * 40)
+        sys.stdout.write(_SEARCH_CLIENTS_MENU)
         
-        choice = input("\nEnter your choice (1-4): ").strip()
+        choice = self._prompt("\nEnter your choice (1-4): ")
         
-        if choice == "1":
-            name = input("Enter name to search: ").strip()
-            clients = Client.find_by_name(self.session, name)
-            
-            if clients:
-                print(f"\nFOUND {len(clients)} CLIENT(S)")
-                print("-" * 70)
-                for client in clients:
-                    print(f"ID: {client.id} | Name: {client.full_name} | Phone: {client.formatted_phone} | Email: {client.email or 'N/A'}")
-            else:
-                print(f"No clients found matching '{name}'")
-                
-        elif choice == "2":
-            phone = input("Enter phone to search: ").strip()
-            client = Client.find_by_phone(self.session, phone)
-            
-            if client:
-                self.display_client_details(client)
-            else:
-                print(f"No client found with phone {phone}")
-                
-        elif choice == "3":
-            email = input("Enter email to search: ").strip()
-            clients = self.session.query(Client).filter(Client.email.ilike(f"%{email}%")).all()
-            
-            if clients:
-                print(f"\nFOUND {len(clients)} CLIENT(S)")
-                print("-" * 70)
-                for client in clients:
-                    print(f"ID: {client.id} | Name: {client.full_name} | Phone: {client.formatted_phone} | Email: {client.email}")
-            else:
-                print(f"No clients found with email containing '{email}'")
-                
-        elif choice == "4":
+        if choice == "4":
             return
+        
+        handler = self._search_clients_dispatch.get(choice)
+        if handler:
+            handler()
         else:
             print("Invalid choice.")
     
+    def search_clients_by_name(self):
+        """Search clients by partial name."""
+        name = self._prompt("Enter name to search: ")
+        clients = Client.search_summary(self.session, name=name)
+        
+        if clients:
+            print(f"\nFOUND {len(clients)} CLIENT(S)")
+            print("-" * 70)
+            for client_id, first_name, last_name, phone, email in clients:
+                print(f"ID: {client_id} | Name: {first_name} {last_name} | Phone: {format_phone(phone)} | Email: {email or 'N/A'}")
+        else:
+            print(f"No clients found matching '{name}'")
+    
+    def search_clients_by_phone(self):
+        """Search for a client by exact phone number."""
+        phone = self._prompt("Enter phone to search: ")
+        client = self._get_client_by_phone(phone)
+        
+        if client:
+            self.display_client_details(client)
+        else:
+            print(f"No client found with phone {phone}")
+    
+    def search_clients_by_email(self):
+        """Search clients by partial email."""
+        email = self._prompt("Enter email to search: ")
+        clients = Client.search_summary(self.session, email=email)
+        
+        if clients:
+            print(f"\nFOUND {len(clients)} CLIENT(S)")
+            print("-" * 70)
+            for client_id, first_name, last_name, phone, client_email in clients:
+                print(f"ID: {client_id} | Name: {first_name} {last_name} | Phone: {format_phone(phone)} | Email: {client_email}")
+        else:
+            print(f"No clients found with email containing '{email}'")
+    
     def search_appointments_by_date_range(self):
         """Search appointments within a date range."""
         print("\nSEARCH APPOINTMENTS BY DATE RANGE")
         print("-" * 40)
         
         try:
-            start_str = input("Start Date (YYYY-MM-DD): ").strip()
-            end_str = input("End Date (YYYY-MM-DD): ").strip()
+            start_str = self._prompt("Start Date (YYYY-MM-DD): ")
+            end_str = self._prompt("End Date (YYYY-MM-DD): ")
             
             if not start_str or not end_str:
                 print("Both start and end dates are required.")
                 return
             
             # Parse dates
-            start_year, start_month, start_day = map(int, start_str.split('-'))
-            end_year, end_month, end_day = map(int, end_str.split('-'))
-            
-            start_date = date(start_year, start_month, start_day)
-            end_date = date(end_year, end_month, end_day)
+            start_date = _parse_date(start_str)
+            end_date = _parse_date(end_str)
             
             if start_date > end_date:
                 print("Start date must be before end date.")
@@ -1648,25 +2160,25 @@ class SalonProCLI:
             start_datetime = datetime.combine(start_date, time.min)
             end_datetime = datetime.combine(end_date, time.max)
             
-            appointments = self.session.query(Appointment).filter(
-                Appointment.appointment_date >= start_datetime,
-                Appointment.appointment_date <= end_datetime
-            ).all()
+            total = Appointment.count_between(self.session, start_datetime, end_datetime)
             
-            if not appointments:
+            if not total:
                 print(f"\nNo appointments found between {start_str} and {end_str}")
                 return
             
-            print(f"\nAPPOINTMENTS BETWEEN {start_str} AND {end_str} ({len(appointments)} total)")
+            print(f"\nAPPOINTMENTS BETWEEN {start_str} AND {end_str} ({total} total)")
             print("-" * 100)
             print(f"{'Date':<12} {'Time':<10} {'Client':<20} {'Stylist':<20} {'Service':<20} {'Status':<12} {'Price':<10}")
             print("-" * 100)
             
-            for app in sorted(appointments, key=lambda x: x.appointment_date):
-                client_name = app.client.full_name if app.client else "N/A"
-                stylist_name = app.stylist.full_name if app.stylist else "N/A"
-                service_name = app.service.name if app.service else "N/A"
-                print(f"{app.date_only:<12} {app.time_only:<10} {client_name:<20} {stylist_name:<20} {service_name:<20} {app.status:<12} ${app.total_price:<9.2f}")
+            # Wide ranges can hold many rows, so they are fetched and written
+            # 500 at a time rather than held in memory all at once
+            rows = Appointment.report_rows(self.session, start=start_datetime, end=end_datetime, batch_size=500)
+            for batch in rows.partitions():
+                sys.stdout.write("".join(
+                    f"{format_date(row.appointment_date):<12} {format_time(row.appointment_date):<10} {row.client_name or 'N/A':<20} {row.stylist_name or 'N/A':<20} {row.service_name or 'N/A':<20} {row.status:<12} {_price_cell(row.total_price)}\n"
+                    for row in batch
+                ))
                 
         except ValueError:
             print("Invalid date format. Use YYYY-MM-DD.")
@@ -1679,35 +2191,28 @@ class SalonProCLI:
         print("-" * 40)
         
         try:
-            start_str = input("Start Date (YYYY-MM-DD): ").strip()
-            end_str = input("End Date (YYYY-MM-DD): ").strip()
+            start_str = self._prompt("Start Date (YYYY-MM-DD): ")
+            end_str = self._prompt("End Date (YYYY-MM-DD): ")
             
             if not start_str or not end_str:
                 print("Both start and end dates are required.")
                 return
             
             # Parse dates
-            start_year, start_month, start_day = map(int, start_str.split('-'))
-            end_year, end_month, end_day = map(int, end_str.split('-'))
-            
-            start_date = date(start_year, start_month, start_day)
-            end_date = date(end_year, end_month, end_day)
+            start_date = _parse_date(start_str)
+            end_date = _parse_date(end_str)
             
             if start_date > end_date:
                 print("Start date must be before end date.")
                 return
             
-            # Calculate total revenue for the period
-            total_revenue = 0
-            current_date = start_date
-            daily_revenues = []
-            
-            while current_date <= end_date:
-                daily_rev = Appointment.get_daily_revenue(self.session, current_date)
-                total_revenue += daily_rev
-                if daily_rev > 0:
-                    daily_revenues.append((current_date, daily_rev))
-                current_date += timedelta(days=1)
+            # Revenue is grouped by day in one query over the whole period
+            daily_revenues = Appointment.revenue_by_day(
+                self.session,
+                datetime.combine(start_date, time.min),
+                datetime.combine(end_date, time.max)
+            )
+            total_revenue = sum(revenue for _, revenue in daily_revenues)
             
             print(f"\nREVENUE REPORT: {start_str} TO {end_str}")
             print("=" * 60)
@@ -1718,8 +2223,8 @@ class SalonProCLI:
             if daily_revenues:
                 print(f"\nDaily Breakdown:")
                 print("-" * 30)
-                for day, rev in sorted(daily_revenues, key=lambda x: x[1], reverse=True):
-                    print(f"  {day.strftime('%Y-%m-%d')}: ${rev:.2f}")
+                for day, rev in daily_revenues:
+                    print(f"  {day}: ${rev:.2f}")
                     
         except ValueError:
             print("Invalid date format. Use YYYY-MM-DD.")
@@ -1728,7 +2233,24 @@ class SalonProCLI:
                         
 def main():
     """Main function to run the CLI."""
-    cli = SalonProCLI()
+    parser = argparse.ArgumentParser(description="SalonPro Manager")
+    parser.add_argument(
+        '--import-appointments', metavar='CSV',
+        help="schedule the appointments in a CSV file and exit instead of starting the menus"
+    )
+    parser.add_argument(
+        '--warn-queries', metavar='N', type=int,
+        help="development aid: report any menu action that runs more than N SQL queries"
+    )
+    args = parser.parse_args()
+
+    cli = SalonProCLI(query_warn_threshold=args.warn_queries)
+    if args.import_appointments:
+        imported = cli.import_appointments(args.import_appointments)
+        cli.session.close()
+        if not imported:
+            sys.exit(1)
+        return
     cli.run()
 
 
@@ -3,8 +3,10 @@ Database configuration for SalonPro Manager.
 This file sets up SQLAlchemy engine and session.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import column, create_engine, event, inspect, text, update
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import StaticPool
 import os
 
 # Create the base class for all models
@@ -12,10 +14,161 @@ Base = declarative_base()
 
 # Create engine - using SQLite for simplicity
 DATABASE_URL = 'sqlite:///salonpro.db'
-engine = create_engine(DATABASE_URL)
+# The CLI is a single process with one session, so every checkout shares a
+# single connection; its pragmas run once and its page cache stays warm
+engine = create_engine(
+    DATABASE_URL,
+    poolclass=StaticPool,
+    connect_args={'check_same_thread': False, 'timeout': 30}
+)
 
-# Create Session class
-Session = sessionmaker(bind=engine)
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use write-ahead logging so commits don't fsync a rollback journal, and
+    give each connection a larger page cache backed by memory-mapped reads."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-20000")  # KiB, i.e. about 20 MB
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+# Create Session class; the CLI commits explicitly, so autoflush only adds
+# redundant flushes before each query. Every write goes through this one
+# session, so objects it holds stay current across commits and need not be
+# expired and reloaded afterwards
+Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+# Trigram full-text index over client names, kept in step with the clients
+# table by triggers; lets substring name searches use an index
+_CLIENT_FTS_DDL = [
+    """CREATE VIRTUAL TABLE client_fts USING fts5(
+        first_name, last_name, content='clients', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS client_fts_ai AFTER INSERT ON clients BEGIN
+        INSERT INTO client_fts(rowid, first_name, last_name)
+        VALUES (new.id, new.first_name, new.last_name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS client_fts_ad AFTER DELETE ON clients BEGIN
+        INSERT INTO client_fts(client_fts, rowid, first_name, last_name)
+        VALUES ('delete', old.id, old.first_name, old.last_name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS client_fts_au AFTER UPDATE OF first_name, last_name ON clients BEGIN
+        INSERT INTO client_fts(client_fts, rowid, first_name, last_name)
+        VALUES ('delete', old.id, old.first_name, old.last_name);
+        INSERT INTO client_fts(rowid, first_name, last_name)
+        VALUES (new.id, new.first_name, new.last_name);
+    END""",
+    "INSERT INTO client_fts(client_fts) VALUES ('rebuild')",
+]
+
+# Same idea for partial email searches, in a table of its own so databases
+# that already have the name index only need this one added
+_CLIENT_EMAIL_FTS_DDL = [
+    """CREATE VIRTUAL TABLE client_email_fts USING fts5(
+        email, content='clients', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS client_email_fts_ai AFTER INSERT ON clients BEGIN
+        INSERT INTO client_email_fts(rowid, email) VALUES (new.id, new.email);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS client_email_fts_ad AFTER DELETE ON clients BEGIN
+        INSERT INTO client_email_fts(client_email_fts, rowid, email)
+        VALUES ('delete', old.id, old.email);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS client_email_fts_au AFTER UPDATE OF email ON clients BEGIN
+        INSERT INTO client_email_fts(client_email_fts, rowid, email)
+        VALUES ('delete', old.id, old.email);
+        INSERT INTO client_email_fts(rowid, email) VALUES (new.id, new.email);
+    END""",
+    "INSERT INTO client_email_fts(client_email_fts) VALUES ('rebuild')",
+]
+
+# And for partial service name searches
+_SERVICE_FTS_DDL = [
+    """CREATE VIRTUAL TABLE service_fts USING fts5(
+        name, content='services', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS service_fts_ai AFTER INSERT ON services BEGIN
+        INSERT INTO service_fts(rowid, name) VALUES (new.id, new.name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS service_fts_ad AFTER DELETE ON services BEGIN
+        INSERT INTO service_fts(service_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS service_fts_au AFTER UPDATE OF name ON services BEGIN
+        INSERT INTO service_fts(service_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        INSERT INTO service_fts(rowid, name) VALUES (new.id, new.name);
+    END""",
+    "INSERT INTO service_fts(service_fts) VALUES ('rebuild')",
+]
+
+# And for partial stylist name searches. The index holds the full name,
+# so a search can span the space between first and last name; being
+# contentless, it is filled from the stylists table directly rather than
+# rebuilt
+_STYLIST_FTS_DDL = [
+    """CREATE VIRTUAL TABLE stylist_fts USING fts5(
+        full_name, content='', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS stylist_fts_ai AFTER INSERT ON stylists BEGIN
+        INSERT INTO stylist_fts(rowid, full_name)
+        VALUES (new.id, new.first_name || ' ' || new.last_name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS stylist_fts_ad AFTER DELETE ON stylists BEGIN
+        INSERT INTO stylist_fts(stylist_fts, rowid, full_name)
+        VALUES ('delete', old.id, old.first_name || ' ' || old.last_name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS stylist_fts_au AFTER UPDATE OF first_name, last_name ON stylists BEGIN
+        INSERT INTO stylist_fts(stylist_fts, rowid, full_name)
+        VALUES ('delete', old.id, old.first_name || ' ' || old.last_name);
+        INSERT INTO stylist_fts(rowid, full_name)
+        VALUES (new.id, new.first_name || ' ' || new.last_name);
+    END""",
+    "INSERT INTO stylist_fts(rowid, full_name) SELECT id, first_name || ' ' || last_name FROM stylists",
+]
+
+_FTS_TABLES = (
+    ('client_fts', _CLIENT_FTS_DDL),
+    ('client_email_fts', _CLIENT_EMAIL_FTS_DDL),
+    ('service_fts', _SERVICE_FTS_DDL),
+    ('stylist_fts', _STYLIST_FTS_DDL),
+)
+
+_fts_ready = False
+
+def fts_match(table_name, needle):
+    """Return a subquery of the rowids whose text in the given full-text
+    table contains the needle, or None when that index cannot answer it."""
+    # The trigram index needs at least three characters to match on
+    if len(needle) < 3 or not _fts_ready:
+        return None
+    phrase = '"' + needle.replace('"', '""') + '"'
+    return text(
+        f"SELECT rowid FROM {table_name} WHERE {table_name} MATCH :phrase"
+    ).bindparams(phrase=phrase).columns(column('rowid'))
+
+def _create_fts():
+    """Create the full-text indexes if missing; older SQLite builds without
+    FTS5 trigram support simply go without them."""
+    global _fts_ready
+    inspector = inspect(engine)
+    for table_name, ddl in _FTS_TABLES:
+        if not inspector.has_table(table_name):
+            try:
+                with engine.begin() as conn:
+                    for statement in ddl:
+                        conn.execute(text(statement))
+            except OperationalError:
+                return
+    _fts_ready = True
+
+def update_by_id(session, model, row_id, values, commit=True):
+    """Apply values to one row with a single UPDATE, without loading it
+    first; returns whether the row exists. With commit=False the caller commits."""
+    result = session.execute(update(model).where(model.id == row_id).values(**values))
+    if commit:
+        session.commit()
+    return result.rowcount > 0
 
 def get_session():
     """Get a new database session."""
@@ -32,6 +185,14 @@ def init_db():
     # Create all tables
     Base.metadata.create_all(engine)
     
+    # create_all() only builds indexes for new tables, so add any that an
+    # existing database file is missing
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    
+    _create_fts()
+    
     print("Database tables created successfully!")
     return get_session()
 
@@ -0,0 +1,25 @@
+"""
+Development helpers for SalonPro Manager.
+Records the SQL a block of code issues, to catch N+1 query patterns.
+"""
+
+from contextlib import contextmanager
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(conn):
+    """Collect every SQL statement run on conn (an engine or connection) inside the block.
+
+    Yields the list the statements are appended to; its length is the query count.
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(conn, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(conn, "before_cursor_execute", before_cursor_execute)
@@ -3,14 +3,32 @@ Appointment model for SalonPro Manager.
 Represents bookings linking clients, stylists, and services.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, CheckConstraint, Text
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, DateTime, ForeignKey, CheckConstraint, Index, Text, case, delete, func, insert, select, text, update
+from sqlalchemy.orm import relationship, validates, joinedload, load_only, selectinload
 from datetime import datetime, time, timedelta
+from bisect import bisect_left, bisect_right, insort
 from database import Base
 
+
+def format_time(moment):
+    """Format a datetime's time as HH:MM AM/PM."""
+    # Built by hand rather than through strftime's format parser
+    hour, minute = moment.hour, moment.minute
+    return f"{hour % 12 or 12:02d}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+def format_date(moment):
+    """Format a datetime's date as YYYY-MM-DD."""
+    return moment.isoformat()[:10]
+
+
 class Appointment(Base):
     __tablename__ = 'appointments'
     
+    # Allowed status values, shared by the CHECK constraint, the validator
+    # and the CLI
+    STATUSES = ('scheduled', 'completed', 'cancelled', 'no-show')
+    
     id = Column(Integer, primary_key=True)
     
     # Foreign keys
@@ -20,7 +38,7 @@ class Appointment(Base):
     
     # Appointment details
     appointment_date = Column(DateTime, nullable=False)
-    duration_minutes = Column(Integer, nullable=False)
+    duration_minutes = Column(SmallInteger, nullable=False)
     status = Column(String(20), default='scheduled')
     notes = Column(Text)
     created_at = Column(DateTime, default=datetime.now)
@@ -31,12 +49,25 @@ class Appointment(Base):
     stylist = relationship("Stylist", back_populates="appointments")
     service = relationship("Service", back_populates="appointments")
     
-    # Check constraint for status
+    # Check constraint for status, plus composite indexes so date-range
+    # lookups (overall or per stylist, client or service) are index range
+    # scans; status and total_price let day listings and revenue totals be
+    # answered from the index alone, and conflict checks and upcoming
+    # schedules seek a stylist's scheduled bookings in a partial index that
+    # leaves out finished and cancelled ones
     __table_args__ = (
         CheckConstraint(
-            "status IN ('scheduled', 'completed', 'cancelled', 'no-show')",
+            "status IN (" + ", ".join(f"'{status}'" for status in STATUSES) + ")",
             name='check_appointment_status'
         ),
+        Index('ix_appointment_date_status_price', 'appointment_date', 'status', 'total_price'),
+        Index('ix_appointment_stylist_date', 'stylist_id', 'appointment_date'),
+        Index(
+            'ix_appointment_stylist_scheduled', 'stylist_id', 'appointment_date',
+            sqlite_where=text("status = 'scheduled'")
+        ),
+        Index('ix_appointment_client_date', 'client_id', 'appointment_date'),
+        Index('ix_appointment_service_date', 'service_id', 'appointment_date'),
     )
     
     def __repr__(self):
@@ -51,12 +82,12 @@ class Appointment(Base):
     @property
     def time_only(self):
         """Get just the time portion."""
-        return self.appointment_date.strftime("%I:%M %p")
+        return format_time(self.appointment_date)
     
     @property
     def date_only(self):
         """Get just the date portion."""
-        return self.appointment_date.strftime("%Y-%m-%d")
+        return format_date(self.appointment_date)
     
     @property
     def end_time(self):
@@ -82,16 +113,15 @@ class Appointment(Base):
     @validates('status')
     def validate_status(self, key, status):
         """Validate status value."""
-        valid_statuses = ['scheduled', 'completed', 'cancelled', 'no-show']
-        if status not in valid_statuses:
-            raise ValueError(f"Status must be one of: {valid_statuses}")
+        if status not in self.STATUSES:
+            raise ValueError(f"Status must be one of: {list(self.STATUSES)}")
         return status
     
     # CLASS METHODS (ORM operations)
     
     @classmethod
-    def create(cls, session, **kwargs):
-        """Create a new appointment with validation."""
+    def create(cls, session, commit=True, **kwargs):
+        """Create a new appointment with validation; with commit=False it is only flushed."""
         # Check for scheduling conflicts
         if cls.has_conflict(session, 
                            kwargs['stylist_id'], 
@@ -101,47 +131,237 @@ class Appointment(Base):
         
         appointment = cls(**kwargs)
         session.add(appointment)
-        session.commit()
+        if commit:
+            session.commit()
+        else:
+            # Flushed so later conflict checks in the same transaction see it
+            session.flush()
         return appointment
     
     @classmethod
-    def get_all(cls, session):
-        """Get all appointments."""
-        return session.query(cls).all()
+    def create_many(cls, session, rows):
+        """Create many appointments in one INSERT and a single commit.
+        
+        Each row is checked, in order, against the stylist's scheduled
+        appointments (fetched with one query for all rows) and the rows
+        accepted before it. Returns (created appointments, indexes of the
+        rows skipped for a scheduling conflict).
+        """
+        if not rows:
+            return [], []
+        starts = [row['appointment_date'] for row in rows]
+        ends = [start + timedelta(minutes=row.get('duration_minutes', 60))
+                for start, row in zip(starts, rows)]
+        
+        # Per stylist: bookings sorted by start, and the longest one, which
+        # bounds how far back an overlapping booking can start
+        booked = {}
+        longest = {}
+        existing = session.query(cls.stylist_id, cls.appointment_date, cls.duration_minutes).filter(
+            cls.stylist_id.in_({row['stylist_id'] for row in rows}),
+            cls.status == 'scheduled',
+            cls.appointment_date < max(ends),
+            cls._end_time() > min(starts)
+        )
+        for stylist_id, start, duration in existing:
+            insort(booked.setdefault(stylist_id, []), (start, start + timedelta(minutes=duration)))
+            longest[stylist_id] = max(longest.get(stylist_id, timedelta(0)), timedelta(minutes=duration))
+        
+        accepted, skipped = [], []
+        for index, (row, start, end) in enumerate(zip(rows, starts, ends)):
+            stylist_id = row['stylist_id']
+            schedule = booked.setdefault(stylist_id, [])
+            low = bisect_right(schedule, (start - longest.get(stylist_id, timedelta(0)), datetime.max))
+            high = bisect_left(schedule, (end,))
+            if any(booked_end > start for _, booked_end in schedule[low:high]):
+                skipped.append(index)
+                continue
+            insort(schedule, (start, end))
+            longest[stylist_id] = max(longest.get(stylist_id, timedelta(0)), end - start)
+            accepted.append(row)
+        
+        created = session.scalars(insert(cls).returning(cls), accepted).all() if accepted else []
+        session.commit()
+        return created, skipped
+    
+    @classmethod
+    def _query(cls, session, with_details):
+        """Start an appointment query, optionally loading client, stylist and service up front."""
+        query = session.query(cls)
+        if with_details:
+            # One extra IN query per relationship instead of one lazy load per row
+            query = query.options(
+                selectinload(cls.client),
+                selectinload(cls.stylist),
+                selectinload(cls.service)
+            )
+        return query
+    
+    @classmethod
+    def _date_order(cls, newest_first=False):
+        """Sort by appointment date, keeping same-time bookings in ID order."""
+        date_order = cls.appointment_date.desc() if newest_first else cls.appointment_date
+        return date_order, cls.id
+    
+    @classmethod
+    def get_all(cls, session, with_details=False, newest_first=False, limit=None, offset=0):
+        """Get all appointments in date order, or one page of them when a limit is given."""
+        query = cls._query(session, with_details).order_by(*cls._date_order(newest_first))
+        if limit is not None:
+            query = query.limit(limit).offset(offset)
+        return query.all()
+    
+    @classmethod
+    def report_rows(cls, session, client_id=None, stylist_id=None, start=None, end=None,
+                    status=None, newest_first=False, limit=None, offset=0, batch_size=None):
+        """Get plain rows for appointment listings, with client, stylist and service names joined in.
+        
+        Each row has id, appointment_date, duration_minutes, status, total_price,
+        client_name, stylist_name and service_name; names are None when the
+        related record is missing. No ORM objects are built. With batch_size
+        the rows are streamed from a result fetched that many at a time
+        instead of returned as a list.
+        """
+        from models.client import Client
+        from models.stylist import Stylist
+        from models.service import Service
+        stmt = select(
+            cls.id, cls.appointment_date, cls.duration_minutes, cls.status, cls.total_price,
+            (Client.first_name + ' ' + Client.last_name).label('client_name'),
+            (Stylist.first_name + ' ' + Stylist.last_name).label('stylist_name'),
+            Service.name.label('service_name')
+        ).outerjoin(Client, cls.client_id == Client.id).outerjoin(
+            Stylist, cls.stylist_id == Stylist.id
+        ).outerjoin(Service, cls.service_id == Service.id)
+        if client_id is not None:
+            stmt = stmt.where(cls.client_id == client_id)
+        if stylist_id is not None:
+            stmt = stmt.where(cls.stylist_id == stylist_id)
+        if start is not None:
+            stmt = stmt.where(cls.appointment_date >= start)
+        if end is not None:
+            stmt = stmt.where(cls.appointment_date <= end)
+        if status is not None:
+            stmt = stmt.where(cls.status == status)
+        stmt = stmt.order_by(*cls._date_order(newest_first))
+        if limit is not None:
+            stmt = stmt.limit(limit).offset(offset)
+        if batch_size is not None:
+            return session.execute(stmt.execution_options(yield_per=batch_size))
+        return session.execute(stmt).all()
+    
+    @classmethod
+    def count_all(cls, session):
+        """Count all appointments."""
+        return session.query(func.count(cls.id)).scalar()
     
     @classmethod
     def find_by_id(cls, session, appointment_id):
         """Find appointment by ID."""
-        return session.query(cls).filter_by(id=appointment_id).first()
+        return session.get(cls, appointment_id)
     
     @classmethod
-    def find_by_client(cls, session, client_id):
-        """Find all appointments for a client."""
-        return session.query(cls).filter_by(client_id=client_id).all()
+    def find_by_client(cls, session, client_id, with_details=False, newest_first=False):
+        """Find all appointments for a client in date order."""
+        return cls._query(session, with_details).filter_by(client_id=client_id).order_by(
+            *cls._date_order(newest_first)
+        ).all()
     
     @classmethod
-    def find_by_stylist(cls, session, stylist_id):
-        """Find all appointments for a stylist."""
-        return session.query(cls).filter_by(stylist_id=stylist_id).all()
+    def iter_by_client_with_details(cls, session, client_id, batch_size=500):
+        """Stream a client's appointments, with stylist and service joined in, batch_size rows at a time."""
+        from models.stylist import Stylist
+        from models.service import Service
+        # Only the columns the listing prints; notes and the rest stay on disk
+        stmt = select(cls).options(
+            load_only(cls.appointment_date, cls.status, cls.total_price),
+            joinedload(cls.stylist).load_only(Stylist.first_name, Stylist.last_name),
+            joinedload(cls.service).load_only(Service.name)
+        ).where(cls.client_id == client_id).execution_options(yield_per=batch_size)
+        return session.scalars(stmt)
     
     @classmethod
-    def find_by_date(cls, session, date):
-        """Find appointments on a specific date."""
+    def find_by_stylist(cls, session, stylist_id, with_details=False, newest_first=False):
+        """Find all appointments for a stylist in date order."""
+        return cls._query(session, with_details).filter_by(stylist_id=stylist_id).order_by(
+            *cls._date_order(newest_first)
+        ).all()
+    
+    @classmethod
+    def find_upcoming_by_stylist(cls, session, stylist_id):
+        """Find a stylist's upcoming appointments in date order, with clients and services loaded up front."""
+        from models.client import Client
+        from models.service import Service
+        return session.query(cls).options(
+            load_only(cls.appointment_date, cls.duration_minutes, cls.total_price),
+            selectinload(cls.client).load_only(Client.first_name, Client.last_name),
+            selectinload(cls.service).load_only(Service.name)
+        ).filter(
+            cls.stylist_id == stylist_id,
+            cls.appointment_date >= datetime.now(),
+            cls.status == 'scheduled'
+        ).order_by(cls.appointment_date, cls.id).all()
+    
+    @classmethod
+    def find_by_date(cls, session, date, with_details=False, status=None):
+        """Find appointments on a specific date, optionally only those with a given status, earliest first."""
         start_date = datetime.combine(date, time.min)
         end_date = datetime.combine(date, time.max)
         
-        return session.query(cls).filter(
+        query = cls._query(session, with_details).filter(
             cls.appointment_date >= start_date,
             cls.appointment_date <= end_date
-        ).all()
+        )
+        if status is not None:
+            query = query.filter(cls.status == status)
+        return query.order_by(*cls._date_order()).all()
     
     @classmethod
-    def find_upcoming(cls, session):
-        """Find all upcoming appointments."""
-        return session.query(cls).filter(
-            cls.appointment_date >= datetime.now(),
+    def count_between(cls, session, start, end):
+        """Count the appointments between two datetimes, inclusive."""
+        return session.query(func.count(cls.id)).filter(
+            cls.appointment_date >= start,
+            cls.appointment_date <= end
+        ).scalar()
+    
+    @classmethod
+    def count_by_date(cls, session, date):
+        """Count the appointments on a specific date."""
+        return cls.count_between(session, datetime.combine(date, time.min), datetime.combine(date, time.max))
+    
+    @classmethod
+    def day_summary(cls, session, date):
+        """Get (total, completed, completed revenue) for the appointments on a date in one query."""
+        completed = cls.status == 'completed'
+        return session.query(
+            func.count(cls.id),
+            func.count(case((completed, 1))),
+            func.coalesce(func.sum(case((completed, cls.total_price))), 0.0)
+        ).filter(
+            cls.appointment_date >= datetime.combine(date, time.min),
+            cls.appointment_date <= datetime.combine(date, time.max)
+        ).one()
+    
+    @classmethod
+    def revenue_by_service(cls, session, start, end):
+        """Get (service name, revenue) from completed appointments between two datetimes, highest first."""
+        from models.service import Service
+        revenue = func.sum(cls.total_price)
+        return session.query(Service.name, revenue).join(
+            Service, cls.service_id == Service.id
+        ).filter(
+            cls.appointment_date >= start,
+            cls.appointment_date <= end,
+            cls.status == 'completed'
+        ).group_by(Service.name).order_by(revenue.desc(), Service.name).all()
+    
+    @classmethod
+    def find_upcoming(cls, session, now=None, with_details=False):
+        """Find all upcoming appointments (from now, or from the given moment), earliest first."""
+        return cls._query(session, with_details).filter(
+            cls.appointment_date >= (now or datetime.now()),
             cls.status == 'scheduled'
-        ).all()
+        ).order_by(*cls._date_order()).all()
     
     @classmethod
     def update(cls, session, appointment_id, **kwargs):
@@ -168,52 +388,61 @@ class Appointment(Base):
     @classmethod
     def delete(cls, session, appointment_id):
         """Delete an appointment."""
-        appointment = cls.find_by_id(session, appointment_id)
-        if appointment:
-            session.delete(appointment)
-            session.commit()
-            return True
-        return False
+        # DELETE ... RETURNING reports whether the row existed in the same statement
+        deleted_id = session.execute(
+            delete(cls).where(cls.id == appointment_id).returning(cls.id)
+        ).scalar_one_or_none()
+        session.commit()
+        return deleted_id is not None
     
     @classmethod
     def cancel(cls, session, appointment_id):
         """Cancel an appointment (soft delete)."""
-        appointment = cls.find_by_id(session, appointment_id)
-        if appointment:
-            appointment.status = 'cancelled'
-            session.commit()
-            return True
-        return False
+        # UPDATE ... RETURNING reports whether the row existed in the same statement
+        cancelled_id = session.execute(
+            update(cls).where(cls.id == appointment_id).values(status='cancelled').returning(cls.id)
+        ).scalar_one_or_none()
+        session.commit()
+        return cancelled_id is not None
+    
+    @classmethod
+    def _end_time(cls):
+        """SQL expression for when an appointment ends."""
+        return func.datetime(cls.appointment_date, '+' + func.cast(cls.duration_minutes, String) + ' minutes')
     
     @classmethod
     def has_conflict(cls, session, stylist_id, start_time, duration_minutes=60, exclude_id=None):
         """Check if a stylist has a scheduling conflict."""
         end_time = start_time + timedelta(minutes=duration_minutes)
         
-        # Get all scheduled appointments for this stylist
-        appointments = session.query(cls).filter(
+        # Overlap is tested in SQL so only the first clash, if any, is fetched
+        query = session.query(cls.id).filter(
             cls.stylist_id == stylist_id,
-            cls.status == 'scheduled'
-        ).all()
+            cls.status == 'scheduled',
+            cls.appointment_date < end_time,
+            cls._end_time() > start_time
+        )
         
         if exclude_id:
-            appointments = [app for app in appointments if app.id != exclude_id]
+            query = query.filter(cls.id != exclude_id)
         
-        # Check each appointment for overlap
-        for appointment in appointments:
-            appointment_end = appointment.appointment_date + timedelta(minutes=appointment.duration_minutes)
-            
-            # Check if time ranges overlap
-            if (start_time < appointment_end) and (end_time > appointment.appointment_date):
-                return True
-        
-        return False
+        return query.first() is not None
     
     @classmethod
     def get_daily_revenue(cls, session, date):
         """Calculate total revenue for a specific day."""
-        appointments = cls.find_by_date(session, date)
-        return sum(app.total_price for app in appointments if app.status == 'completed')
+        return cls.day_summary(session, date)[2]
+    
+    @classmethod
+    def revenue_by_day(cls, session, start, end):
+        """Get (YYYY-MM-DD, revenue) for each day between two datetimes with completed revenue, highest first."""
+        day = func.date(cls.appointment_date)
+        revenue = func.sum(cls.total_price)
+        return session.query(day, revenue).filter(
+            cls.appointment_date >= start,
+            cls.appointment_date <= end,
+            cls.status == 'completed'
+        ).group_by(day).having(revenue > 0).order_by(revenue.desc(), day).all()
     
     # Instance method
     def get_service_details(self):
@@ -3,10 +3,26 @@ Client model for SalonPro Manager.
 Represents salon customers with their contact information.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, delete, exists, func, insert, or_, select
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from database import Base
+from database import Base, fts_match, update_by_id
+from functools import lru_cache
+import re
+
+# Compiled once at import and shared by every validity check
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+# Listings format the same few numbers over and over, so results are
+# memoized by raw value; unlike a per-instance cache this cannot go stale
+@lru_cache(maxsize=4096)
+def format_phone(phone):
+    """Format a 10-digit phone number as (XXX) XXX-XXXX."""
+    if len(phone) == 10:
+        return f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
+    return phone
+
 
 class Client(Base):
     __tablename__ = 'clients'
@@ -35,57 +51,126 @@ class Client(Base):
     def email_is_valid(self):
         if not self.email:
             return False
-        return '@' in self.email and '.' in self.email
+        return _EMAIL_RE.fullmatch(self.email) is not None
     
     # Property method for phone formatting
     @property
     def formatted_phone(self):
-        if len(self.phone) == 10:
-            return f"({self.phone[:3]}) {self.phone[3:6]}-{self.phone[6:]}"
-        return self.phone
+        return format_phone(self.phone)
     
     # CLASS METHODS (ORM operations)
     
     @classmethod
     def create(cls, session, **kwargs):
         """Create a new client."""
-        client = cls(**kwargs)
-        session.add(client)
+        # INSERT ... RETURNING hands back the stored row in the same round-trip
+        client = session.scalars(insert(cls).returning(cls), [kwargs]).one()
         session.commit()
         return client
     
+    @classmethod
+    def bulk_create(cls, session, rows):
+        """Create many clients from a list of dicts in one executemany INSERT."""
+        clients = session.scalars(insert(cls).returning(cls), rows).all()
+        session.commit()
+        return clients
+    
     @classmethod
     def get_all(cls, session):
         """Get all clients."""
         return session.query(cls).all()
     
+    @classmethod
+    def get_names(cls, session, limit=None):
+        """Get (id, first_name, last_name) rows in ID order, at most limit of them."""
+        return session.execute(
+            select(cls.id, cls.first_name, cls.last_name).order_by(cls.id).limit(limit)
+        ).all()
+    
+    @classmethod
+    def get_all_summary(cls, session, batch_size=500):
+        """Stream (id, first_name, last_name, phone, email) rows for every client, batch_size at a time."""
+        return session.execute(
+            select(cls.id, cls.first_name, cls.last_name, cls.phone, cls.email)
+        ).yield_per(batch_size)
+    
+    @classmethod
+    def count_all(cls, session):
+        """Count all clients."""
+        return session.query(func.count(cls.id)).scalar()
+    
     @classmethod
     def find_by_id(cls, session, client_id):
         """Find client by ID."""
-        return session.query(cls).filter_by(id=client_id).first()
+        return session.get(cls, client_id)
+    
+    @classmethod
+    def find_with_stats(cls, session, client_id):
+        """Find a client together with its appointment count in one query; returns (client, count) or None."""
+        from models.appointment import Appointment
+        return session.query(cls, func.count(Appointment.id)).outerjoin(
+            Appointment, Appointment.client_id == cls.id
+        ).filter(cls.id == client_id).group_by(cls.id).first()
     
     @classmethod
     def find_by_phone(cls, session, phone):
         """Find client by phone number."""
         return session.query(cls).filter_by(phone=phone).first()
     
+    @classmethod
+    def find_name_by_phone(cls, session, phone, exclude_id=None):
+        """Return the full name of the client holding a phone number, or None, without loading the row."""
+        query = select(cls.first_name, cls.last_name).where(cls.phone == phone)
+        if exclude_id is not None:
+            query = query.where(cls.id != exclude_id)
+        row = session.execute(query.limit(1)).first()
+        return f"{row.first_name} {row.last_name}" if row else None
+    
+    @classmethod
+    def find_phones_in(cls, session, phones):
+        """Return the subset of the given phone numbers already registered."""
+        if not phones:
+            return set()
+        return set(session.scalars(select(cls.phone).where(cls.phone.in_(phones))))
+    
+    @classmethod
+    def _contains(cls, fts_table, needle, *columns):
+        """Build a filter for clients whose given columns contain the needle."""
+        matches = fts_match(fts_table, needle)
+        if matches is not None:
+            return cls.id.in_(matches)
+        return or_(*(col.ilike(f"%{needle}%") for col in columns))
+    
     @classmethod
     def find_by_name(cls, session, name):
         """Find clients by name (partial match)."""
         return session.query(cls).filter(
-            (cls.first_name.ilike(f"%{name}%")) | 
-            (cls.last_name.ilike(f"%{name}%"))
-        ).all()
+            cls._contains('client_fts', name, cls.first_name, cls.last_name)
+        ).order_by(cls.id).all()
+    
+    @classmethod
+    def find_by_email(cls, session, email):
+        """Find clients by email (partial match)."""
+        return session.query(cls).filter(
+            cls._contains('client_email_fts', email, cls.email)
+        ).order_by(cls.id).all()
+    
+    @classmethod
+    def search_summary(cls, session, name=None, email=None):
+        """Get (id, first_name, last_name, phone, email) rows for clients matching a partial name or email."""
+        query = select(cls.id, cls.first_name, cls.last_name, cls.phone, cls.email)
+        if name is not None:
+            query = query.where(cls._contains('client_fts', name, cls.first_name, cls.last_name))
+        if email is not None:
+            query = query.where(cls._contains('client_email_fts', email, cls.email))
+        return session.execute(query.order_by(cls.id)).all()
     
     @classmethod
     def update(cls, session, client_id, **kwargs):
         """Update client information."""
-        client = cls.find_by_id(session, client_id)
-        if client:
-            for key, value in kwargs.items():
-                setattr(client, key, value)
-            session.commit()
-        return client
+        if update_by_id(session, cls, client_id, kwargs):
+            return session.get(cls, client_id)
+        return None
     
     @classmethod
     def delete(cls, session, client_id):
@@ -97,6 +182,43 @@ class Client(Base):
             return True
         return False
     
+    @classmethod
+    def count_appointments(cls, session, client_id):
+        """Count a client's appointments without loading them."""
+        from models.appointment import Appointment
+        return session.query(func.count(Appointment.id)).filter(
+            Appointment.client_id == client_id
+        ).scalar()
+    
+    @classmethod
+    def appointment_stats(cls, session):
+        """Get (clients with appointments, total appointments, most, fewest) over clients that have any."""
+        from models.appointment import Appointment
+        per_client = select(func.count(Appointment.id).label('n')).join(
+            cls, Appointment.client_id == cls.id
+        ).group_by(Appointment.client_id).subquery()
+        return session.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(per_client.c.n), 0),
+                func.max(per_client.c.n),
+                func.min(per_client.c.n)
+            ).select_from(per_client)
+        ).one()
+    
+    @classmethod
+    def delete_if_no_appointments(cls, session, client_id):
+        """Delete a client only if it has no appointments, in one statement; returns True if deleted."""
+        from models.appointment import Appointment
+        result = session.execute(
+            delete(cls).where(
+                cls.id == client_id,
+                ~exists().where(Appointment.client_id == client_id)
+            )
+        )
+        session.commit()
+        return result.rowcount > 0
+    
     # Instance method
     def get_appointments(self, session):
         """Get all appointments for this client."""
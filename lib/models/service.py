@@ -3,10 +3,30 @@ Service model for SalonPro Manager.
 Represents services offered by the salon (haircut, color, treatment, etc.).
 """
 
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Index, Integer, SmallInteger, String, Float, Text, DateTime, bindparam, case, func, select
+from sqlalchemy.orm import relationship, selectinload
 from datetime import datetime
-from database import Base
+from database import Base, fts_match, update_by_id
+from functools import lru_cache
+
+
+# A menu has only a handful of distinct prices and durations, so each is
+# formatted once and reused by every listing that shows it
+@lru_cache(maxsize=512)
+def format_price(price):
+    """Format a price as $X.XX."""
+    return f"${price:.2f}"
+
+
+@lru_cache(maxsize=512)
+def format_duration(duration_minutes):
+    """Format a duration in minutes as hours and minutes."""
+    hours, minutes = divmod(duration_minutes, 60)
+    
+    if hours > 0:
+        return f"{hours}h {minutes}min"
+    return f"{minutes}min"
+
 
 class Service(Base):
     __tablename__ = 'services'
@@ -14,14 +34,20 @@ class Service(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False, unique=True)
     description = Column(Text)
-    duration_minutes = Column(Integer, nullable=False)  # Duration in minutes
+    duration_minutes = Column(SmallInteger, nullable=False)  # Duration in minutes
     price = Column(Float, nullable=False)
     category = Column(String(50))  # e.g., "Haircut", "Color", "Treatment"
-    is_active = Column(Integer, default=1)  # 1 = active, 0 = inactive
-    created_at = Column(DateTime, default=datetime.now)
+    is_active = Column(Boolean, default=True, nullable=False)
+    created_at = Column(DateTime, default=func.datetime('now', 'localtime'))
     
     # One-to-many relationship with appointments
-    appointments = relationship("Appointment", back_populates="service", cascade="all, delete-orphan")
+    appointments = relationship("Appointment", back_populates="service", cascade="all, delete-orphan", lazy="raise_on_sql")
+    
+    # Category lookups seek this index; is_active rides along so listing
+    # only the active ones in a category needs no table lookups to filter
+    __table_args__ = (
+        Index('ix_services_category_active', 'category', 'is_active'),
+    )
     
     def __repr__(self):
         return f"<Service(id={self.id}, name='{self.name}', price=${self.price}, duration={self.duration_minutes}min)>"
@@ -29,17 +55,12 @@ class Service(Base):
     # Property methods
     @property
     def formatted_price(self):
-        return f"${self.price:.2f}"
+        return format_price(self.price)
     
     @property
     def formatted_duration(self):
         """Format duration as hours and minutes."""
-        hours = self.duration_minutes // 60
-        minutes = self.duration_minutes % 60
-        
-        if hours > 0:
-            return f"{hours}h {minutes}min"
-        return f"{minutes}min"
+        return format_duration(self.duration_minutes)
     
     @property
     def hourly_rate(self):
@@ -51,61 +72,120 @@ class Service(Base):
     # CLASS METHODS (ORM operations)
     
     @classmethod
-    def create(cls, session, **kwargs):
-        """Create a new service."""
+    def create(cls, session, commit=True, **kwargs):
+        """Create a new service; with commit=False it is only flushed."""
         service = cls(**kwargs)
         session.add(service)
-        session.commit()
+        if commit:
+            session.commit()
+        else:
+            session.flush()
         return service
     
     @classmethod
     def get_all(cls, session):
         """Get all services."""
-        return session.query(cls).all()
+        return session.scalars(_ALL_SERVICES).all()
+    
+    @classmethod
+    def get_all_with_appointments(cls, session):
+        """Get all services with their appointments loaded in one extra IN query."""
+        return session.query(cls).options(selectinload(cls.appointments)).all()
+    
+    @classmethod
+    def get_summary(cls, session, active_only=False):
+        """Get (id, name, category, duration_minutes, price, is_active) rows for every service, or only active ones."""
+        return session.execute(_ACTIVE_SERVICE_SUMMARY if active_only else _SERVICE_SUMMARY).all()
     
     @classmethod
     def get_active(cls, session):
         """Get only active services."""
-        return session.query(cls).filter_by(is_active=1).all()
+        return session.scalars(_ACTIVE_SERVICES).all()
     
     @classmethod
     def find_by_id(cls, session, service_id):
         """Find service by ID."""
-        return session.query(cls).filter_by(id=service_id).first()
+        return session.get(cls, service_id)
     
     @classmethod
     def find_by_name(cls, session, name):
         """Find services by name (partial match)."""
-        return session.query(cls).filter(cls.name.ilike(f"%{name}%")).all()
+        matches = fts_match('service_fts', name)
+        if matches is not None:
+            return session.query(cls).filter(cls.id.in_(matches)).order_by(cls.id).all()
+        return session.query(cls).filter(cls.name.ilike(f"%{name}%")).order_by(cls.id).all()
+    
+    @classmethod
+    def find_id_by_name(cls, session, name):
+        """Get the ID of the service with exactly this name, or None."""
+        return session.scalar(select(cls.id).where(cls.name == name))
     
     @classmethod
     def find_by_category(cls, session, category):
         """Find services by category."""
-        return session.query(cls).filter_by(category=category).all()
+        return session.scalars(_SERVICES_BY_CATEGORY, {'category': category}).all()
     
     @classmethod
-    def update(cls, session, service_id, **kwargs):
-        """Update service information."""
-        service = cls.find_by_id(session, service_id)
-        if service:
-            for key, value in kwargs.items():
-                setattr(service, key, value)
-            session.commit()
-        return service
+    def update(cls, session, service_id, commit=True, **kwargs):
+        """Update service information; with commit=False the caller commits."""
+        if update_by_id(session, cls, service_id, kwargs, commit):
+            return session.get(cls, service_id)
+        return None
     
     @classmethod
-    def delete(cls, session, service_id):
-        """Deactivate a service."""
-        service = cls.find_by_id(session, service_id)
-        if service:
-            service.is_active = 0  # Soft delete
-            session.commit()
-            return True
-        return False
+    def delete(cls, session, service_id, commit=True):
+        """Deactivate a service; with commit=False the caller commits."""
+        return update_by_id(session, cls, service_id, {'is_active': False}, commit)
+    
+    @classmethod
+    def count_appointments(cls, session, service_id):
+        """Count a service's bookings without loading them."""
+        from models.appointment import Appointment
+        return session.query(func.count(Appointment.id)).filter(
+            Appointment.service_id == service_id
+        ).scalar()
+    
+    @classmethod
+    def count_upcoming_appointments(cls, session, service_id):
+        """Count a service's scheduled appointments that have not started yet."""
+        from models.appointment import Appointment
+        return session.query(func.count(Appointment.id)).filter(
+            Appointment.service_id == service_id,
+            Appointment.appointment_date >= datetime.now(),
+            Appointment.status == 'scheduled'
+        ).scalar()
+    
+    @classmethod
+    def popularity_stats(cls, session):
+        """Get (name, category, total bookings, completed bookings, completed revenue) per service, most booked first."""
+        from models.appointment import Appointment
+        completed = Appointment.status == 'completed'
+        total_bookings = func.count(Appointment.id)
+        return session.execute(
+            select(
+                cls.name,
+                cls.category,
+                total_bookings,
+                func.count(case((completed, 1))),
+                func.coalesce(func.sum(case((completed, Appointment.total_price))), 0.0)
+            ).outerjoin(Appointment, Appointment.service_id == cls.id).group_by(cls.id).order_by(
+                total_bookings.desc(), cls.id
+            )
+        ).all()
     
     # Instance method - FIXED: import inside method to avoid circular import
     def get_appointments(self, session):
         """Get all appointments for this service."""
         # Import here to avoid circular import
         from models.appointment import Appointment
-        return session.query(Appointment).filter_by(service_id=self.id).all()
\ No newline at end of file
+        return session.query(Appointment).filter_by(service_id=self.id).all()
+
+
+# Prebuilt listing statements, as in models/stylist.py
+_ALL_SERVICES = select(Service)
+_ACTIVE_SERVICES = select(Service).where(Service.is_active)
+_SERVICES_BY_CATEGORY = select(Service).where(Service.category == bindparam('category'))
+_SERVICE_SUMMARY = select(
+    Service.id, Service.name, Service.category, Service.duration_minutes, Service.price, Service.is_active
+)
+_ACTIVE_SERVICE_SUMMARY = _SERVICE_SUMMARY.where(Service.is_active)
@@ -3,10 +3,12 @@ Stylist model for SalonPro Manager.
 Represents hair stylists/beauticians working at the salon.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Float
-from sqlalchemy.orm import relationship
-from datetime import datetime
-from database import Base
+from sqlalchemy import Boolean, Column, Index, Integer, String, DateTime, Float, bindparam, case, exists, func, select, update
+from sqlalchemy.orm import relationship, selectinload
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, time
+from database import Base, fts_match, update_by_id
+from models.client import format_phone
 
 class Stylist(Base):
     __tablename__ = 'stylists'
@@ -17,12 +19,20 @@ class Stylist(Base):
     phone = Column(String(20), unique=True, nullable=False)
     email = Column(String(100), unique=True, nullable=False)
     specialty = Column(String(100))  # e.g., "Coloring", "Men's cuts", "Extensions"
-    hire_date = Column(DateTime, default=datetime.now)
+    # Stamped by SQLite inside the INSERT, in local time like every other
+    # timestamp here, and handed back through RETURNING
+    hire_date = Column(DateTime, default=func.datetime('now', 'localtime'))
     hourly_rate = Column(Float, default=25.0)
-    is_active = Column(Integer, default=1)  # 1 = active, 0 = inactive
+    is_active = Column(Boolean, default=True, nullable=False)
     
     # One-to-many relationship with appointments
-    appointments = relationship("Appointment", back_populates="stylist", cascade="all, delete-orphan")
+    appointments = relationship("Appointment", back_populates="stylist", cascade="all, delete-orphan", lazy="raise_on_sql")
+    
+    # Specialty lookups seek this index; is_active rides along so listing
+    # only the active ones in a specialty needs no table lookups to filter
+    __table_args__ = (
+        Index('ix_stylists_specialty_active', 'specialty', 'is_active'),
+    )
     
     def __repr__(self):
         return f"<Stylist(id={self.id}, name='{self.first_name} {self.last_name}', specialty='{self.specialty}')>"
@@ -34,11 +44,9 @@ class Stylist(Base):
     
     @property
     def formatted_phone(self):
-        if len(self.phone) == 10:
-            return f"({self.phone[:3]}) {self.phone[3:6]}-{self.phone[6:]}"
-        return self.phone
+        return format_phone(self.phone)
     
-    @property
+    @hybrid_property
     def experience_years(self):
         """Calculate years of experience since hire date."""
         if self.hire_date:
@@ -46,55 +54,197 @@ class Stylist(Base):
             return round(delta.days / 365.25, 1)
         return 0
     
+    @experience_years.expression
+    def experience_years(cls):
+        """The same figure computed in SQL, so queries can filter and sort on it."""
+        # hire_date is stored in local time; whole days, as timedelta.days gives
+        days = func.cast(func.julianday('now', 'localtime') - func.julianday(cls.hire_date), Integer)
+        return func.coalesce(func.round(days / 365.25, 1), 0)
+    
     # CLASS METHODS (ORM operations)
     
     @classmethod
-    def create(cls, session, **kwargs):
-        """Create a new stylist."""
+    def create(cls, session, commit=True, **kwargs):
+        """Create a new stylist; with commit=False it is only flushed."""
         stylist = cls(**kwargs)
         session.add(stylist)
-        session.commit()
+        if commit:
+            session.commit()
+        else:
+            session.flush()
         return stylist
     
     @classmethod
     def get_all(cls, session):
         """Get all stylists."""
-        return session.query(cls).all()
+        return session.scalars(_ALL_STYLISTS).all()
+    
+    @classmethod
+    def get_all_summary(cls, session, batch_size=500):
+        """Stream (id, first_name, last_name, specialty, hourly_rate, is_active) rows for every stylist, batch_size at a time."""
+        return session.execute(
+            select(cls.id, cls.first_name, cls.last_name, cls.specialty, cls.hourly_rate, cls.is_active)
+        ).yield_per(batch_size)
+    
+    @classmethod
+    def count_all(cls, session):
+        """Count all stylists."""
+        return session.query(func.count(cls.id)).scalar()
+    
+    @classmethod
+    def get_all_with_appointments(cls, session):
+        """Get all stylists with their appointments loaded in one extra IN query."""
+        return session.query(cls).options(selectinload(cls.appointments)).all()
+    
+    @classmethod
+    def get_active_with_todays_appointments(cls, session):
+        """Get (stylist, today's appointments) pairs for the active stylists, in two queries."""
+        from models.appointment import Appointment
+        # Returned alongside rather than loaded into .appointments: the
+        # session keeps objects across commits, so a filtered collection
+        # would later pass for the stylist's full list
+        today = datetime.now().date()
+        stylists = session.scalars(_ACTIVE_STYLISTS).all()
+        todays = {stylist.id: [] for stylist in stylists}
+        if todays:
+            appointments = session.scalars(
+                select(Appointment).where(
+                    Appointment.stylist_id.in_(todays),
+                    Appointment.appointment_date >= datetime.combine(today, time.min),
+                    Appointment.appointment_date <= datetime.combine(today, time.max)
+                ).order_by(Appointment.appointment_date)
+            )
+            for appointment in appointments:
+                todays[appointment.stylist_id].append(appointment)
+        return [(stylist, todays[stylist.id]) for stylist in stylists]
     
     @classmethod
     def get_active(cls, session):
         """Get only active stylists."""
-        return session.query(cls).filter_by(is_active=1).all()
+        return session.scalars(_ACTIVE_STYLISTS).all()
     
     @classmethod
     def find_by_id(cls, session, stylist_id):
         """Find stylist by ID."""
-        return session.query(cls).filter_by(id=stylist_id).first()
+        return session.get(cls, stylist_id)
     
     @classmethod
-    def find_by_specialty(cls, session, specialty):
-        """Find stylists by specialty."""
-        return session.query(cls).filter_by(specialty=specialty).all()
+    def find_name_by_phone(cls, session, phone, exclude_id=None):
+        """Return the full name of the stylist holding a phone number, or None, without loading the row."""
+        query = select(cls.first_name, cls.last_name).where(cls.phone == phone)
+        if exclude_id is not None:
+            query = query.where(cls.id != exclude_id)
+        row = session.execute(query.limit(1)).first()
+        return f"{row.first_name} {row.last_name}" if row else None
     
     @classmethod
-    def update(cls, session, stylist_id, **kwargs):
-        """Update stylist information."""
-        stylist = cls.find_by_id(session, stylist_id)
-        if stylist:
-            for key, value in kwargs.items():
-                setattr(stylist, key, value)
-            session.commit()
-        return stylist
+    def find_by_name(cls, session, name):
+        """Find stylists whose full name contains the given text (partial match)."""
+        matches = fts_match('stylist_fts', name)
+        if matches is not None:
+            criterion = cls.id.in_(matches)
+        else:
+            criterion = (cls.first_name + ' ' + cls.last_name).ilike(f"%{name}%")
+        return session.scalars(select(cls).where(criterion).order_by(cls.id)).all()
     
     @classmethod
-    def delete(cls, session, stylist_id):
-        """Delete (deactivate) a stylist."""
-        stylist = cls.find_by_id(session, stylist_id)
-        if stylist:
-            stylist.is_active = 0  # Soft delete
-            session.commit()
-            return True
-        return False
+    def find_by_specialty(cls, session, specialty, active_only=False, limit=None, offset=0):
+        """Find stylists by specialty in ID order, a page of at most limit rows from offset."""
+        # Both filters go to SQL so the (specialty, is_active) index answers them
+        query = _ACTIVE_STYLISTS_BY_SPECIALTY if active_only else _STYLISTS_BY_SPECIALTY
+        return session.scalars(query.limit(limit).offset(offset), {'specialty': specialty}).all()
+    
+    @classmethod
+    def update(cls, session, stylist_id, commit=True, **kwargs):
+        """Update stylist information; with commit=False the caller commits."""
+        if update_by_id(session, cls, stylist_id, kwargs, commit):
+            return session.get(cls, stylist_id)
+        return None
+    
+    @classmethod
+    def bulk_deactivate(cls, session, stylist_ids):
+        """Deactivate several stylists with a single UPDATE; returns how many rows changed."""
+        result = session.execute(
+            update(cls).where(cls.id.in_(stylist_ids)).values(is_active=False)
+        )
+        session.commit()
+        return result.rowcount
+    
+    @classmethod
+    def delete(cls, session, stylist_id, commit=True):
+        """Delete (deactivate) a stylist; with commit=False the caller commits."""
+        return update_by_id(session, cls, stylist_id, {'is_active': False}, commit)
+    
+    @classmethod
+    def count_appointments(cls, session, stylist_id):
+        """Count a stylist's appointments without loading them."""
+        from models.appointment import Appointment
+        return session.query(func.count(Appointment.id)).filter(
+            Appointment.stylist_id == stylist_id
+        ).scalar()
+    
+    @classmethod
+    def client_summary(cls, session, stylist_id):
+        """Get (client_id, first_name, last_name, appointment_count) for each client a stylist has seen."""
+        from models.appointment import Appointment
+        from models.client import Client
+        return session.execute(
+            select(Client.id, Client.first_name, Client.last_name, func.count(Appointment.id))
+            .join(Appointment, Appointment.client_id == Client.id)
+            .where(Appointment.stylist_id == stylist_id)
+            .group_by(Client.id)
+            .order_by(Client.id)
+        ).all()
+    
+    @classmethod
+    def performance_stats(cls, session):
+        """Get (first_name, last_name, specialty, total, completed, completed revenue) per stylist, in ID order."""
+        from models.appointment import Appointment
+        completed = Appointment.status == 'completed'
+        return session.execute(
+            select(
+                cls.first_name,
+                cls.last_name,
+                cls.specialty,
+                func.count(Appointment.id),
+                func.count(case((completed, 1))),
+                func.coalesce(func.sum(case((completed, Appointment.total_price))), 0.0)
+            ).outerjoin(Appointment, Appointment.stylist_id == cls.id).group_by(cls.id).order_by(cls.id)
+        ).all()
+    
+    @classmethod
+    def count_upcoming_appointments(cls, session, stylist_id):
+        """Count a stylist's scheduled appointments that have not started yet."""
+        from models.appointment import Appointment
+        return session.query(func.count(Appointment.id)).filter(
+            Appointment.stylist_id == stylist_id,
+            Appointment.appointment_date >= datetime.now(),
+            Appointment.status == 'scheduled'
+        ).scalar()
+    
+    @classmethod
+    def has_upcoming_appointments(cls, session, stylist_id):
+        """Check whether a stylist has any upcoming appointment, stopping at the first match."""
+        from models.appointment import Appointment
+        return session.query(
+            exists().where(
+                Appointment.stylist_id == stylist_id,
+                Appointment.appointment_date >= datetime.now(),
+                Appointment.status == 'scheduled'
+            )
+        ).scalar()
+    
+    @classmethod
+    def ids_with_upcoming_appointments(cls, session, stylist_ids):
+        """Return which of the given stylists have an upcoming appointment."""
+        from models.appointment import Appointment
+        return set(session.scalars(
+            select(Appointment.stylist_id).where(
+                Appointment.stylist_id.in_(stylist_ids),
+                Appointment.appointment_date >= datetime.now(),
+                Appointment.status == 'scheduled'
+            ).distinct()
+        ))
     
     # Instance method
     def get_appointments(self, session):
@@ -105,9 +255,20 @@ class Stylist(Base):
     def get_todays_appointments(self, session):
         """Get today's appointments for this stylist."""
         from models.appointment import Appointment
-        from datetime import date
-        today = date.today()
-        return session.query(Appointment).filter_by(
-            stylist_id=self.id,
-            appointment_date=today
-        ).all()
\ No newline at end of file
+        # appointment_date holds a datetime, so match the whole day
+        today = datetime.now().date()
+        return session.query(Appointment).filter(
+            Appointment.stylist_id == self.id,
+            Appointment.appointment_date >= datetime.combine(today, time.min),
+            Appointment.appointment_date <= datetime.combine(today, time.max)
+        ).order_by(Appointment.appointment_date).all()
+
+
+# Listing statements are built once at import, so each call reuses the
+# cached compiled SQL instead of assembling a new query
+_ALL_STYLISTS = select(Stylist)
+_ACTIVE_STYLISTS = select(Stylist).where(Stylist.is_active)
+_STYLISTS_BY_SPECIALTY = select(Stylist).where(
+    Stylist.specialty == bindparam('specialty')
+).order_by(Stylist.id)
+_ACTIVE_STYLISTS_BY_SPECIALTY = _STYLISTS_BY_SPECIALTY.where(Stylist.is_active)